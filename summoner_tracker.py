@@ -1,13 +1,41 @@
 import sys
+import os
+import itertools
+import math
+import json
+import base64
+import struct
+import asyncio
+import time
+import zlib
+import atexit
+import hashlib
+import hmac
+import gzip
+import mmap
+import re
+import shutil
+import tarfile
+import functools
+import threading
+import bisect
+from array import array
+from urllib.parse import urlsplit, parse_qs
+from collections import OrderedDict, deque
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QLabel, QPushButton,
     QGridLayout, QSpinBox, QLineEdit, QHBoxLayout, QMessageBox,
     QComboBox, QStackedLayout, QGraphicsOpacityEffect, QGraphicsDropShadowEffect,
-    QSlider, QCheckBox
+    QSlider, QCheckBox, QTabWidget
 )
-from PyQt5.QtCore import QTimer, Qt, QSize, QRect
-from PyQt5.QtGui import QPixmap, QIcon, QIntValidator, QFont, QColor
+from PyQt5 import sip
+from PyQt5.QtCore import (
+    QTimer, Qt, QSize, QRect, QEvent, QObject, QRunnable, QThreadPool, pyqtSignal
+)
+from PyQt5.QtGui import QPixmap, QImage, QIcon, QIntValidator, QFont, QColor
+from PyQt5.QtNetwork import QUdpSocket, QHostAddress, QAbstractSocket
 
 # ----------------------------
 # UI Tuning – central controls
@@ -18,6 +46,9 @@ AH_MAX_CHARS = 3         # Ability Haste max digits (0–999)
 TOPBTN_SIZE = 30         # Size of the top-right toolbar buttons (min 30 to avoid emoji clipping)
 TOPBTN_ICON = 26         # <-- Inner icon size for toolbar buttons so styled borders remain visible
 BG_SCALE = 1.0           # Crest target scale (keep at 1.0 for crispness)
+COALESCED_TICK_MS = 5000 # Low-power mode: display refresh while the window sits behind other windows
+PAGE_PREBUILD_DELAY_MS = 1500  # After the first paint, secondary pages are built one per idle slice
+ABILITY_COLUMNS = range(7, 13)  # Q/CD/W/CD/E/CD in the enemy grid (hidden unless enabled in Settings)
 
 # ----------------------------
 # Themes catalog
@@ -40,41 +71,927 @@ THEMES = {
     },
 }
 
+# ----------------------------
+# Instrumentation (opt-in)
+# ----------------------------
+TRACE_FILE = os.environ.get("SUMMONER_TRACKER_TRACE")                   # Chrome-trace JSON path written at exit
+TRACE_OVERLAY = os.environ.get("SUMMONER_TRACKER_TRACE_OVERLAY") == "1"  # Live counters line on the main page
+TRACE_MAX_EVENTS = 200_000                                               # Newest events kept for the trace file
+WATCHDOG = os.environ.get("SUMMONER_TRACKER_WATCHDOG") == "1"            # Event-loop stall detector
+FRAME_MS = 16.7          # A GUI-thread block longer than one frame counts as a stall
+HEARTBEAT_MS = 10        # Watchdog heartbeat on the GUI thread (only while WATCHDOG is on)
+WATCHDOG_POLL_MS = 5     # How often the watchdog thread checks the heartbeat / samples the GUI stack
+
+class Tracer:
+    """
+    Collects spans and counters as Chrome-trace events (load the file in chrome://tracing
+    or Perfetto). When disabled, @traced returns functions untouched and count() is a no-op.
+    Events are only kept when there is a file to export them to (the overlay needs just the
+    latest values), and then only the newest TRACE_MAX_EVENTS.
+    """
+    def __init__(self, path, enabled):
+        self.path = path
+        self.enabled = enabled
+        self.events = deque(maxlen=TRACE_MAX_EVENTS) if path else None
+        self.counters = {}
+        self.last_ms = {}  # most recent duration per span, for the overlay
+        self._t0 = time.perf_counter()
+        self._pid = os.getpid()
+
+    def _us(self, t):
+        return (t - self._t0) * 1e6
+
+    def complete(self, name, start, end):
+        self.last_ms[name] = (end - start) * 1000
+        if self.events is None:
+            return
+        self.events.append({
+            "name": name, "ph": "X", "pid": self._pid, "tid": threading.get_ident(),
+            "ts": self._us(start), "dur": self._us(end) - self._us(start),
+        })
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.gauge(name, self.counters.get(name, 0) + n)
+
+    def gauge(self, name, value):
+        if not self.enabled:
+            return
+        self.counters[name] = value
+        if self.events is None:
+            return
+        self.events.append({
+            "name": name, "ph": "C", "pid": self._pid, "tid": 0,
+            "ts": self._us(time.perf_counter()), "args": {name: value},
+        })
+
+    def export(self):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump({"traceEvents": list(self.events), "displayTimeUnit": "ms"}, f)
+        except OSError as e:
+            print("Error writing trace:", e)
+
+tracer = Tracer(TRACE_FILE, bool(TRACE_FILE) or TRACE_OVERLAY)
+atexit.register(tracer.export)
+
+class LatencyHistogram:
+    """Millisecond latencies in power-of-two buckets (<1, 1-2, 2-4, ... >=1024) plus count and max."""
+    BOUNDS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.n = 0
+        self.max = 0.0
+
+    def add(self, ms):
+        self.counts[bisect.bisect_right(self.BOUNDS, ms)] += 1
+        self.n += 1
+        self.max = max(self.max, ms)
+
+    def percentile(self, p):
+        """Upper bound (ms) of the bucket holding the p-th percentile."""
+        target = self.n * p / 100
+        seen = 0
+        for bound, count in zip(self.BOUNDS + (math.inf,), self.counts):
+            seen += count
+            if seen >= target:
+                return bound
+        return math.inf
+
+    def summary(self):
+        if not self.n:
+            return "no samples"
+        return f"n={self.n} p50<{self.percentile(50)}ms p99<{self.percentile(99)}ms max {self.max:.1f}ms"
+
+def _handler_name(frame):
+    """'outermost handler of this module › innermost function' for a GUI-thread stack."""
+    inner = frame.f_code.co_name
+    handler = None
+    while frame is not None:
+        code = frame.f_code
+        if code.co_filename == __file__ and code.co_name not in ("<module>", "wrapper"):
+            handler = getattr(code, "co_qualname", code.co_name)
+        frame = frame.f_back
+    return f"{handler or 'Qt'} › {inner}"
+
+class StallWatchdog:
+    """
+    A heartbeat QTimer on the GUI thread and a watchdog thread that samples the GUI thread's
+    Python stack whenever the heartbeat is overdue. Each late heartbeat is a stall, attributed
+    to the handler seen most often in the samples taken during it.
+    """
+    def __init__(self):
+        self.lateness = LatencyHistogram()  # every heartbeat: how late it ran
+        self.stalls = {}                    # handler -> [count, total ms, worst ms]
+        self._gui_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._samples = []
+        self._samples_lock = threading.Lock()  # appended by the watchdog thread, swapped here
+        self.timer = QTimer()
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self._heartbeat)
+        self.timer.start(HEARTBEAT_MS)
+        threading.Thread(target=self._watch, name="stall-watchdog", daemon=True).start()
+        atexit.register(lambda: print(self.report()))
+
+    def _heartbeat(self):
+        now = time.monotonic()
+        late_ms = max(0.0, (now - self._beat) * 1000 - HEARTBEAT_MS)
+        self._beat = now
+        self.lateness.add(late_ms)
+        with self._samples_lock:
+            samples, self._samples = self._samples, []
+        if late_ms > FRAME_MS:
+            handler = max(set(samples), key=samples.count) if samples else "(between samples)"
+            entry = self.stalls.setdefault(handler, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += late_ms
+            entry[2] = max(entry[2], late_ms)
+            tracer.gauge("stall_ms", round(late_ms, 1))
+
+    def _watch(self):
+        while True:
+            time.sleep(WATCHDOG_POLL_MS / 1000)
+            if (time.monotonic() - self._beat) * 1000 > HEARTBEAT_MS + FRAME_MS:
+                frame = sys._current_frames().get(self._gui_thread)
+                if frame is not None:
+                    handler = _handler_name(frame)
+                    with self._samples_lock:
+                        self._samples.append(handler)
+
+    def report(self):
+        lines = [f"GUI heartbeat lateness: {self.lateness.summary()}"]
+        worst = sorted(self.stalls.items(), key=lambda kv: -kv[1][1])[:5]
+        lines += [f"  stall x{n} total {total:.0f}ms worst {w:.0f}ms: {handler}" for handler, (n, total, w) in worst]
+        return "\n".join(lines)
+
+_stall_watchdog = None
+
+def stall_watchdog():
+    """Shared StallWatchdog (one per process, however many lobbies are open)."""
+    global _stall_watchdog
+    if _stall_watchdog is None:
+        _stall_watchdog = StallWatchdog()
+    return _stall_watchdog
+
+def traced(name=None):
+    """Decorator: time each call as a trace span when tracing is enabled."""
+    def deco(fn):
+        if not tracer.enabled:
+            return fn
+        label = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                tracer.complete(label, start, time.perf_counter())
+        return wrapper
+    return deco
+
+# ----------------------------
+# Network health (per-host circuit breaker + offline mode)
+# ----------------------------
+HTTP_CONNECT_TIMEOUT = 3   # Seconds to establish a connection; the read timeout is per call
+HTTP_RETRIES = 2           # Extra attempts for timeouts / 5xx, with exponential backoff
+HTTP_BACKOFF = 0.5         # First retry delay in seconds (doubles each attempt)
+BREAKER_THRESHOLD = 3      # Consecutive failures before a host's circuit opens
+BREAKER_COOLDOWN = 30      # Seconds an open circuit stays open (doubles while the host keeps failing, max 10 min)
+OFFLINE_PROBE_INTERVAL = 60  # Seconds between reconnect probes while offline
+OFFLINE_AFTER_ERRORS = 3     # Consecutive connection errors (any host) that mean the network went away
+
+class HostUnavailable(requests.ConnectionError):
+    """Raised without touching the network when a host's circuit (or the whole network) is open."""
+
+class NetworkHealth:
+    """
+    Tracks health per host. A host that keeps failing is short-circuited for a cooldown. A
+    connection failure before anything has answered, or OFFLINE_AFTER_ERRORS in a row later in
+    the session, puts the tracker in offline mode: every request fails instantly (callers fall
+    back to the disk cache and text placeholders) until a periodic probe gets through again.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts = {}           # host -> {"failures", "open_until", "cooldown"}
+        self.offline = False
+        self._probe_at = 0.0
+        self._seen_success = False
+        self._connection_errors = 0  # consecutive, across hosts; reset by any success
+
+    def _check(self, host):
+        now = time.monotonic()
+        with self._lock:
+            if self.offline:
+                if now < self._probe_at:
+                    raise HostUnavailable(f"offline; {host} not contacted")
+                self._probe_at = now + OFFLINE_PROBE_INTERVAL  # this caller is the probe
+                return
+            state = self._hosts.get(host)
+            if state and now < state["open_until"]:
+                raise HostUnavailable(f"circuit open for {host}")
+
+    def _success(self, host):
+        with self._lock:
+            self._hosts.pop(host, None)
+            self._seen_success = True
+            self._connection_errors = 0
+            if self.offline:
+                self.offline = False
+                print("Network is back; leaving offline mode.")
+
+    def _failure(self, host, connection_error):
+        now = time.monotonic()
+        with self._lock:
+            self._connection_errors = self._connection_errors + 1 if connection_error else 0
+            lost = not self._seen_success or self._connection_errors >= OFFLINE_AFTER_ERRORS
+            if connection_error and lost and not self.offline:
+                self.offline = True
+                self._probe_at = now + OFFLINE_PROBE_INTERVAL
+                print("Network unavailable; running offline from the local cache.")
+            state = self._hosts.setdefault(host, {"failures": 0, "open_until": 0.0, "cooldown": 0})
+            state["failures"] += 1
+            if state["failures"] >= BREAKER_THRESHOLD:
+                state["cooldown"] = min(max(state["cooldown"] * 2, BREAKER_COOLDOWN), 600)
+                state["open_until"] = now + state["cooldown"]
+                tracer.count("circuit_opens")
+
+    def get(self, url, timeout):
+        """requests.get with breaker/offline checks and retry-with-backoff for transient errors."""
+        host = url.split("/", 3)[2]
+        self._check(host)
+        for attempt in range(HTTP_RETRIES + 1):
+            try:
+                resp = requests.get(url, timeout=(HTTP_CONNECT_TIMEOUT, timeout))
+            except requests.ConnectionError:
+                self._failure(host, connection_error=True)
+                raise  # unreachable host / no network: retrying now would only block longer
+            except requests.Timeout:
+                self._failure(host, connection_error=False)
+                if attempt == HTTP_RETRIES:
+                    raise
+            else:
+                if resp.status_code < 500:
+                    self._success(host)
+                    return resp
+                self._failure(host, connection_error=False)
+                if attempt == HTTP_RETRIES:
+                    return resp
+            time.sleep(HTTP_BACKOFF * (2 ** attempt))
+            self._check(host)
+
+network = NetworkHealth()
+
+# ----------------------------
+# Local disk cache
+# ----------------------------
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".summoner_tracker")
+DDRAGON_CDN = "https://ddragon.leagueoflegends.com/cdn/"
+
+def _cache_path(*parts):
+    path = os.path.join(CACHE_DIR, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+def _write_atomic(path, data: bytes):
+    """Write via temp file + rename so a crash never leaves a half-written cache entry."""
+    tmp = f"{path}.{threading.get_ident()}.tmp"  # per-thread: image workers may race on one path
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def _asset_cache_path(url):
+    """
+    DDragon assets are keyed by their CDN path including the patch version
+    (<version>/img/champion/Ahri.png), so a patch that changes an icon is never served stale;
+    anything else is keyed by a hash of the URL.
+    """
+    if url.startswith(DDRAGON_CDN):
+        return _cache_path(*url[len(DDRAGON_CDN):].split("/"))
+    ext = os.path.splitext(url.split("?", 1)[0])[1] or ".bin"
+    return _cache_path("ext", hashlib.sha1(url.encode()).hexdigest()[:16] + ext)
+
+def _read_cached(path):
+    try:
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+DRAGONTAIL_PATH = os.environ.get("SUMMONER_TRACKER_DRAGONTAIL", "")  # dragontail-<version>.tgz/.tar; empty = HTTP only
+
+class DragontailMirror:
+    """
+    Serves DDragon URLs from a local dragontail bundle (e.g. on a shared drive). A .tgz is
+    decompressed once into the cache; a member index (name -> offset, size) is built once and
+    kept beside it, and each read is a slice of an mmap of the tar, so nothing is extracted.
+    """
+    def __init__(self, path):
+        self.tar_path = self.tar_for(path)
+        self.index = self._load_index()
+        self.version = _bundle_version(path) or next(
+            (name.split("/", 1)[0] for name in self.index if re.match(r"\d+\.\d+\.\d+/", name)), None)
+        with open(self.tar_path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def tar_for(path):
+        """The tar to map: `path` itself, or its decompressed copy in the cache for a .tgz."""
+        if not path.endswith((".tgz", ".gz")):
+            return path
+        name = re.sub(r"\.(tgz|tar\.gz|gz)$", "", os.path.basename(path)) + ".tar"
+        return _cache_path("dragontail", name)
+
+    @classmethod
+    def needs_decompress(cls, path):
+        out = cls.tar_for(path)
+        return out != path and (not os.path.exists(out) or os.path.getmtime(out) < os.path.getmtime(path))
+
+    @classmethod
+    def decompress(cls, path):
+        out = cls.tar_for(path)
+        tmp = f"{out}.tmp"
+        with gzip.open(path, "rb") as src, open(tmp, "wb") as dst:
+            shutil.copyfileobj(src, dst, 1 << 20)
+        os.replace(tmp, out)
+
+    def _load_index(self):
+        """Member offsets, rebuilt only when the tar changes (keyed by its size and mtime)."""
+        stat = os.stat(self.tar_path)
+        stamp = [stat.st_size, int(stat.st_mtime)]
+        index_path = _cache_path("dragontail", os.path.basename(self.tar_path) + ".index.json")
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                saved = json.load(f)
+            if saved["stamp"] == stamp:
+                return saved["members"]
+        except (OSError, ValueError, KeyError):
+            pass
+        members = {}
+        with tarfile.open(self.tar_path, "r:") as tf:
+            for member in tf:
+                if member.isfile():
+                    name = member.name[2:] if member.name.startswith("./") else member.name
+                    members[name] = (member.offset_data, member.size)
+        _write_atomic(index_path, json.dumps({"stamp": stamp, "members": members}).encode())
+        return members
+
+    def read(self, url):
+        """Bytes for a DDragon CDN URL ("<version>/img/..." in the bundle), or None."""
+        if not url.startswith(DDRAGON_CDN):
+            return None
+        member = self.index.get(url[len(DDRAGON_CDN):])
+        if member is None:
+            return None
+        offset, size = member
+        tracer.count("mirror_hits")
+        return self._mm[offset:offset + size]
+
+def _bundle_version(path):
+    """Patch version from a dragontail-<version>.tgz/.tar file name, if it has one."""
+    match = re.search(r"dragontail-(\d[\w.]*?)\.t", os.path.basename(path))
+    return match.group(1) if match else None
+
+def _open_dragontail():
+    """
+    The mirror, or None. A .tgz that has not been decompressed yet is decompressed on a
+    background thread (it can be several GB) and the mirror is switched on when it is done;
+    until then assets come over HTTP.
+    """
+    if not DRAGONTAIL_PATH:
+        return None
+    try:
+        if DragontailMirror.needs_decompress(DRAGONTAIL_PATH):
+            threading.Thread(target=_decompress_dragontail, name="dragontail", daemon=True).start()
+            return None
+        return DragontailMirror(DRAGONTAIL_PATH)
+    except (OSError, tarfile.TarError, ValueError) as e:
+        print(f"Error opening dragontail bundle {DRAGONTAIL_PATH}: {e}")
+        return None
+
+def _decompress_dragontail():
+    global dragontail
+    print(f"Decompressing {DRAGONTAIL_PATH} in the background (one time); using HTTP meanwhile...")
+    try:
+        DragontailMirror.decompress(DRAGONTAIL_PATH)
+        dragontail = DragontailMirror(DRAGONTAIL_PATH)
+        print("Dragontail bundle ready.")
+    except (OSError, EOFError, tarfile.TarError, ValueError) as e:
+        print(f"Error decompressing dragontail bundle {DRAGONTAIL_PATH}: {e}")
+
+dragontail = _open_dragontail()
+
+def _get_json(url):
+    """DDragon JSON from the dragontail mirror when it has it, else over HTTP."""
+    data = dragontail.read(url) if dragontail else None
+    if data is not None:
+        return json.loads(data)
+    return network.get(url, timeout=8).json()
+
+def _fetch_bytes(url, refresh=False):
+    """
+    Return the asset bytes, from the disk cache when present, else from the network.
+    With refresh=True the network is tried first and the cached copy is the fallback.
+    """
+    return _fetch_asset(url, refresh)[0]
+
+def _fetch_asset(url, refresh=False):
+    """_fetch_bytes plus whether the server definitely has no such asset (HTTP 404): (data, not_found)."""
+    # The bundle wins over the disk cache; it only holds URLs of its own patch version
+    data = dragontail.read(url) if dragontail else None
+    if data is not None:
+        return data, False  # already local; not copied into the cache
+    path = _asset_cache_path(url)
+    if not refresh and os.path.exists(path):
+        tracer.count("cache_hits")
+        return _read_cached(path), False
+    tracer.count("cache_misses")
+    not_found = False
+    try:
+        resp = network.get(url, timeout=8)
+        if resp.status_code == 200:
+            tracer.count("bytes_fetched", len(resp.content))
+            _write_atomic(path, resp.content)
+            return resp.content, False
+        not_found = resp.status_code == 404
+    except HostUnavailable:
+        pass
+    except Exception as e:
+        print(f"Error fetching asset at {url}: {e}")
+    return (_read_cached(path) if refresh else None), not_found
+
 # ----------------------------
 # DataDragon helpers (JSON only pre-QApplication)
 # ----------------------------
+FALLBACK_VERSION = "15.11.1"
+
+def _cached_version():
+    """Patch of the local champion cache, if any (used when DDragon cannot be reached)."""
+    try:
+        with open(_cache_path("champions", "index.json"), encoding="utf-8") as f:
+            return json.load(f)["version"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+@functools.lru_cache(maxsize=1)
 def get_latest_version():
+    version = dragontail.version if dragontail else _bundle_version(DRAGONTAIL_PATH)
+    if version:
+        return version  # the mirror defines the patch; no network needed
     try:
-        return requests.get('https://ddragon.leagueoflegends.com/api/versions.json', timeout=5).json()[0]
+        return network.get('https://ddragon.leagueoflegends.com/api/versions.json', timeout=5).json()[0]
     except Exception:
-        return "15.11.1"  # fallback
-
-def get_champion_data():
+        return _cached_version() or FALLBACK_VERSION
+
+def _champion_hash(entry):
+    """Hash of the whole entry, spells (and so ability cooldowns) included."""
+    return hashlib.sha1(json.dumps(entry, sort_keys=True).encode()).hexdigest()
+
+def _champion_icon_files(entry):
+    """(group, file) of every DDragon icon a championFull entry references."""
+    files = [("champion", entry.get("image", {}).get("full")),
+             ("passive", entry.get("passive", {}).get("image", {}).get("full"))]
+    files += [("spell", spell.get("image", {}).get("full")) for spell in entry.get("spells", [])]
+    return [(group, name) for group, name in files if name]
+
+def _carry_forward_icons(old_version, version, entries):
+    """
+    Hardlink (copy where links are not supported) the cached icons of `entries` from the old
+    patch's directory into the new one, so unchanged champions are not downloaded again.
+    """
+    carried = 0
+    for entry in entries:
+        for group, name in _champion_icon_files(entry):
+            src = os.path.join(CACHE_DIR, old_version, "img", group, name)
+            dst = os.path.join(CACHE_DIR, version, "img", group, name)
+            if os.path.exists(dst) or not os.path.exists(src):
+                continue
+            try:
+                os.makedirs(os.path.dirname(dst), exist_ok=True)
+                try:
+                    os.link(src, dst)
+                except OSError:
+                    shutil.copyfile(src, dst)
+                carried += 1
+            except OSError as e:
+                print(f"Error keeping cached icon {src}: {e}")
+    return carried
+
+def _drop_old_asset_patches(version):
+    """Remove cached DDragon assets of other patches (<CACHE_DIR>/<x.y.z>/...)."""
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        if name != version and re.fullmatch(r"\d+\.\d+\.\d+", name):
+            shutil.rmtree(os.path.join(CACHE_DIR, name), ignore_errors=True)
+
+def _load_champion_cache():
+    """Return (index, data) from the per-champion cache, or (None, None) if missing/corrupt."""
+    try:
+        with open(_cache_path("champions", "index.json"), encoding="utf-8") as f:
+            index = json.load(f)
+        data = {}
+        for champ_id in index["hashes"]:
+            with open(_cache_path("champions", f"{champ_id}.json"), encoding="utf-8") as f:
+                data[champ_id] = json.load(f)
+        return index, data
+    except (OSError, ValueError, KeyError):
+        return None, None
+
+def _write_champion_entry(champ_id, entry):
+    _write_atomic(_cache_path("champions", f"{champ_id}.json"), json.dumps(entry).encode())
+
+def _write_champion_index(version, hashes):
+    index = {"version": version, "hashes": hashes}
+    _write_atomic(_cache_path("champions", "index.json"), json.dumps(index).encode())
+
+def _download_full_champion_data(version):
+    url = f"{DDRAGON_CDN}{version}/data/en_US/championFull.json"
+    data = _get_json(url)["data"]
+    hashes = {}
+    for champ_id, entry in data.items():
+        _write_champion_entry(champ_id, entry)
+        hashes[champ_id] = _champion_hash(entry)
+    _write_champion_index(version, hashes)
+    _drop_old_asset_patches(version)
+    return data
+
+def _update_champion_data(version, index, data):
+    """
+    Patch-update mode: diff every championFull.json entry (spells included) against the
+    cached hashes, rewrite only the champions that changed and carry the cached icons of
+    the others over to the new patch, so only changed champions' icons are downloaded.
+
+    The JSON itself is still downloaded whole: DDragon publishes no per-champion change
+    list, and every per-champion file embeds the patch version, so conditional requests
+    against the new URLs could never come back 304.
+
+    All-or-nothing: the merged table is built aside and only returned once the download
+    succeeded, and the index is written last, so a failure leaves the previous patch's
+    cache intact.
+    """
+    url = f"{DDRAGON_CDN}{version}/data/en_US/championFull.json"
+    full = _get_json(url)["data"]
+    old_hashes = index["hashes"]
+    hashes = {champ_id: _champion_hash(entry) for champ_id, entry in full.items()}
+    for champ_id, entry in full.items():
+        if old_hashes.get(champ_id) != hashes[champ_id] or champ_id not in data:
+            _write_champion_entry(champ_id, entry)
+    for champ_id in set(data) - set(full):
+        try:
+            os.remove(_cache_path("champions", f"{champ_id}.json"))
+        except OSError:
+            pass
+    _write_champion_index(version, hashes)
+    unchanged = [data[champ_id] for champ_id in full if champ_id in data and old_hashes.get(champ_id) == hashes[champ_id]]
+    carried = _carry_forward_icons(index["version"], version, unchanged)
+    print(f"Patch {version}: {len(full) - len(unchanged)} of {len(full)} champions changed; "
+          f"kept {carried} cached icons")
+    _drop_old_asset_patches(version)
+    return full
+
+def get_champion_data(full=False):
+    """
+    Champion data for the latest patch, served from the local cache. A new patch rewrites
+    only the champions that changed; pass full=True to force a complete re-download. If the
+    update fails, the previous patch's data is returned unchanged (with its own version).
+    """
     version = get_latest_version()
-    url = f"https://ddragon.leagueoflegends.com/cdn/{version}/data/en_US/championFull.json"
+    index, data = (None, None) if full else _load_champion_cache()
     try:
-        return requests.get(url, timeout=8).json()
+        if index is None:
+            data = _download_full_champion_data(version)
+        elif index["version"] != version:
+            data = _update_champion_data(version, index, data)
+    except HostUnavailable:
+        if data is None:
+            return {}
+        version = index["version"]
     except Exception as e:
         print("Error fetching champion data:", e)
+        if data is None:
+            return {}
+        version = index["version"]
+    return {"version": version, "data": data}
+
+def get_summoner_data(version):
+    """summoner.json for `version`, from the disk cache once downloaded (the URL names the patch)."""
+    url = f"{DDRAGON_CDN}{version}/data/en_US/summoner.json"
+    data = _fetch_bytes(url)
+    try:
+        return json.loads(data) if data else {}
+    except ValueError as e:
+        print("Error reading summoner data:", e)
         return {}
 
-# NOTE: Pixmap creation must be called AFTER QApplication exists.
-def _fetch_pixmap(url):
-    try:
-        resp = requests.get(url, timeout=8)
-        if resp.status_code == 200:
-            pm = QPixmap()
-            pm.loadFromData(resp.content)
-            return pm
-    except Exception as e:
-        print(f"Error fetching image at {url}: {e}")
-    return None
+# ----------------------------
+# Pixmap memory (display-size variants only)
+# ----------------------------
+PIXMAP_BUDGET_MB = 8  # Resident budget for decoded images; least-recently-used variants are evicted past it
+
+def pixmap_cost(pm):
+    return pm.width() * pm.height() * max(pm.depth(), 8) // 8
+
+class PixmapStore:
+    """
+    LRU of display-size pixmaps keyed by (url, size). The full-resolution decode is dropped
+    as soon as it is scaled; a later miss re-decodes it from the disk cache. Pixmaps held
+    outside the LRU (e.g. the window-sized crest) are accounted via pin().
+    """
+    def __init__(self, budget_bytes):
+        self.budget = budget_bytes
+        self._items = OrderedDict()  # (url, size) -> QPixmap
+        self._pinned = {}            # name -> bytes
+        self.lru_bytes = 0
+
+    @property
+    def resident(self):
+        return self.lru_bytes + sum(self._pinned.values())
+
+    def lookup(self, url, size):
+        key = (url, size)
+        pm = self._items.get(key)
+        if pm is not None:
+            self._items.move_to_end(key)
+        return pm
+
+    def put(self, url, size, pm):
+        key = (url, size)
+        if key in self._items:
+            self.lru_bytes -= pixmap_cost(self._items.pop(key))
+        self._items[key] = pm
+        self.lru_bytes += pixmap_cost(pm)
+        self._evict()
+
+    def pin(self, name, pm):
+        if pm is None:
+            self._pinned.pop(name, None)
+        else:
+            self._pinned[name] = pixmap_cost(pm)
+        self._evict()
+
+    def _evict(self):
+        while self.resident > self.budget and len(self._items) > 1:
+            _, pm = self._items.popitem(last=False)
+            self.lru_bytes -= pixmap_cost(pm)
+            tracer.count("pixmap_evictions")
+        tracer.gauge("pixmap_resident_kb", self.resident // 1024)
+
+    def report(self):
+        return (f"{self.resident / 1048576:.1f} / {self.budget / 1048576:.0f} MB "
+                f"({len(self._items)} icons)")
+
+pixmap_store = PixmapStore(PIXMAP_BUDGET_MB * 1024 * 1024)
+
+# ----------------------------
+# Icon atlas (pre-scaled raw ARGB, memory-mapped)
+# ----------------------------
+ATLAS_DIR = "atlas"
+ATLAS_FORMAT = QImage.Format_ARGB32_Premultiplied  # What QPixmap uses natively, so no conversion either
+ATLAS_FLUSH_MS = 2000  # Index writes are batched: one write this long after the last new icon (and at exit)
+
+class IconAtlas:
+    """
+    Raw pixels of every icon decoded at one (size, device pixel ratio) for the current patch,
+    appended to one file with an index {url: [offset, width, height]}. A lookup copies the
+    bytes out of a read-only mapping into a QImage (no decode, no resampling).
+
+    The data file is append-only and never truncated or rewritten, so another instance that
+    has it mapped cannot fault on it; an index entry past the end of the file is dropped
+    instead. add() runs on the loader's worker threads; lookup() and flush_later() on the
+    GUI thread.
+    """
+    def __init__(self, size, dpr, version):
+        stem = f"{version}-{size}@{dpr:g}x"
+        self.data_path = _cache_path(ATLAS_DIR, stem + ".argb")
+        self.index_path = _cache_path(ATLAS_DIR, stem + ".json")
+        self._drop_other_patches(version)
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        try:
+            data_size = os.path.getsize(self.data_path)
+        except OSError:
+            data_size = 0
+        self.index = {url: entry for url, entry in index.items() if entry[0] + entry[1] * entry[2] * 4 <= data_size}
+        self._lock = threading.Lock()  # index and data file, shared with the worker threads
+        self._dirty = False
+        self._mm = None   # one mapping of the whole file, replaced when the file has grown
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush)
+        atexit.register(self.flush)
+
+    @staticmethod
+    def _drop_other_patches(version):
+        # Unlinking is safe even if another instance still maps the file: the mapping keeps
+        # the data alive (and where the OS refuses, e.g. Windows, it is retried next start).
+        directory = os.path.dirname(_cache_path(ATLAS_DIR, "x"))
+        for name in os.listdir(directory):
+            if not name.startswith(f"{version}-"):
+                try:
+                    os.remove(os.path.join(directory, name))
+                except OSError:
+                    pass
+
+    def _remap(self):
+        if self._mm is not None:
+            self._mm.close()  # nothing points into it: lookups hand out copies
+            self._mm = None
+        with open(self.data_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def lookup(self, url):
+        with self._lock:
+            entry = self.index.get(url)
+        if entry is None:
+            return None
+        offset, w, h = entry
+        end = offset + w * h * 4
+        if self._mm is None or end > len(self._mm):
+            self._remap()  # appended after the current mapping
+        tracer.count("atlas_hits")
+        return QImage(self._mm[offset:end], w, h, w * 4, ATLAS_FORMAT).copy()
+
+    def add(self, url, img):
+        """Append `img` (worker thread); the index is written by the next flush."""
+        with self._lock:
+            if url in self.index:
+                return
+        img = img.convertToFormat(ATLAS_FORMAT)
+        bits = img.constBits()
+        bits.setsize(img.sizeInBytes())
+        data = bytes(bits)
+        with self._lock:
+            if url in self.index:
+                return
+            try:
+                with open(self.data_path, "ab", buffering=0) as f:  # one O_APPEND write
+                    if f.write(data) != len(data):
+                        return
+                    offset = f.tell() - len(data)
+            except OSError as e:
+                print(f"Error appending to icon atlas {self.data_path}: {e}")
+                return
+            self.index[url] = [offset, img.width(), img.height()]
+            self._dirty = True
+
+    def flush_later(self):
+        """GUI thread: write the index ATLAS_FLUSH_MS after the last call."""
+        self._flush_timer.start(ATLAS_FLUSH_MS)
 
-def get_champion_icon(champ_name, version):
-    if champ_name in champion_data.get("data", {}):
-        url = f"https://ddragon.leagueoflegends.com/cdn/{version}/img/champion/{champ_name}.png"
-        return _fetch_pixmap(url)
-    return None
+    def flush(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            data = json.dumps(self.index).encode()
+        try:
+            _write_atomic(self.index_path, data)
+        except OSError as e:
+            print(f"Error writing icon atlas index {self.index_path}: {e}")
+
+# ----------------------------
+# Off-GUI-thread image loading
+# ----------------------------
+MISSING_TTL = 300  # Seconds an icon URL that 404ed (or did not decode) is answered with None from memory
+PREFETCH_WARM_CHAMPIONS = 15  # Most-picked champions (from recorded games) warmed once the window is idle
+
+class _ImageJob(QRunnable):
+    """Worker: fetch bytes (disk cache or network), decode and smooth-scale to a QImage."""
+    def __init__(self, loader, key, atlas=None):
+        super().__init__()
+        self.loader = loader
+        self.key = key
+        self.atlas = atlas
+
+    @traced("decode_image")
+    def run(self):
+        if self.key in self.loader.cancelled:
+            self.loader.skipped.emit(self.key)  # speculative job nobody wants any more
+            return
+        url, size, icon = self.key
+        if icon:
+            size = round(size * self.loader.dpr)  # device pixels
+        img = None
+        data, missing = _fetch_asset(url)
+        if data:
+            img = QImage()
+            if not img.loadFromData(data) or img.isNull():
+                img, missing = None, True  # fetched but not an image: retrying will not help
+            elif icon or img.width() > size or img.height() > size:  # non-icons are never upscaled
+                tracer.count("pixmap_scales")
+                img = img.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            if img is not None and self.atlas is not None:
+                self.atlas.add(url, img)
+        self.loader.decoded.emit(self.key, img, missing)  # queued to the GUI thread
+
+class AssetLoader(QObject):
+    """
+    Download, decode and scaling run on a small thread pool as QImage; only the cheap
+    QPixmap.fromImage conversion and the callbacks run on the GUI thread. Icons (icon=True)
+    land in pixmap_store, so repeated requests are answered synchronously from memory.
+    Speculative requests (prefetch) queue behind real ones and can be cancelled until they start.
+    Decoded icons are also appended (by the worker) to the per-size IconAtlas, so later
+    sessions skip decoding.
+    """
+    decoded = pyqtSignal(object, object, bool)  # key, QImage or None, definitely missing
+    skipped = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(4)
+        self._waiting = {}      # (url, size, icon) -> [(callback, speculative)]
+        self._queued = {}       # key -> priority of the job queued for it
+        self._missing = {}      # key -> time.monotonic() of a 404 (not retried for MISSING_TTL)
+        self.cancelled = set()  # keys whose queued job should be skipped (read by workers)
+        self.dpr = QApplication.instance().devicePixelRatio()
+        self._atlases = {}      # icon size -> IconAtlas
+        self.decoded.connect(self._on_decoded)
+        self.skipped.connect(self._on_skipped)
+
+    def request(self, url, size, callback, icon=True, speculative=False):
+        """callback(QPixmap or None) on the GUI thread; immediately if the icon is resident."""
+        key = (url, size, icon)
+        if icon:
+            pm = pixmap_store.lookup(url, size)
+            if pm is None:
+                pm = self._from_atlas(url, size)
+            if pm is not None or time.monotonic() - self._missing.get(key, -MISSING_TTL) < MISSING_TTL:
+                callback(pm)
+                return
+        self._waiting.setdefault(key, []).append((callback, speculative))
+        priority = -1 if speculative else 0
+        self.cancelled.discard(key)  # wanted again
+        if self._queued.get(key, -2) < priority:  # none queued, or only a low-priority prefetch
+            self._queued[key] = priority
+            self.pool.start(_ImageJob(self, key, self._atlas(size) if icon else None), priority)
+
+    def _atlas(self, size):
+        atlas = self._atlases.get(size)
+        if atlas is None:
+            atlas = self._atlases[size] = IconAtlas(size, self.dpr, dd_version)
+        return atlas
+
+    def _from_atlas(self, url, size):
+        img = self._atlas(size).lookup(url)
+        if img is None:
+            return None
+        pm = QPixmap.fromImage(img)
+        pm.setDevicePixelRatio(self.dpr)
+        pixmap_store.put(url, size, pm)
+        return pm
+
+    def cancel(self, key):
+        """Drop speculative interest in `key`; its job is skipped if it has not started yet."""
+        waiting = [w for w in self._waiting.get(key, []) if not w[1]]
+        if waiting:
+            self._waiting[key] = waiting
+        elif key in self._queued:
+            self._waiting.pop(key, None)
+            self.cancelled.add(key)
+
+    def _on_skipped(self, key):
+        self._queued.pop(key, None)
+        self.cancelled.discard(key)
+        for callback, speculative in self._waiting.pop(key, []):  # wanted again after the job gave up
+            self.request(key[0], key[1], callback, key[2], speculative)
+
+    def _on_decoded(self, key, img, missing):
+        self._queued.pop(key, None)
+        self.cancelled.discard(key)
+        pm = QPixmap.fromImage(img) if img is not None else None
+        if key[2]:
+            if pm is not None:
+                pm.setDevicePixelRatio(self.dpr)
+                pixmap_store.put(key[0], key[1], pm)
+                self._atlas(key[1]).flush_later()
+            elif missing:  # e.g. the {Champion}R.png guess; timeouts / open breakers are retried
+                self._missing[key] = time.monotonic()
+        for callback, _ in self._waiting.pop(key, []):
+            callback(pm)
+
+_asset_loader = None
+
+def asset_loader():
+    """Shared AssetLoader (created on first use, after QApplication exists)."""
+    global _asset_loader
+    if _asset_loader is None:
+        _asset_loader = AssetLoader()
+    return _asset_loader
+
+def champion_icon_url(champ_name, version):
+    return f"https://ddragon.leagueoflegends.com/cdn/{version}/img/champion/{champ_name}.png"
 
 # Summoner spell icon names on DDragon
 SUMMONER_SPELLS = {
@@ -93,23 +1010,22 @@ SUMMONER_SPELLS = {
 # Hard-coded Unleashed Teleport icon (not reliably on DDragon)
 UNLEASHED_TP_WIKI_URL = "https://wiki.leagueoflegends.com/en-us/images/Unleashed_Teleport.png?f93be"
 
-def get_summoner_icon(spell_name, version):
+def summoner_icon_urls(spell_name, version):
     if spell_name in ("U. Teleport", "Unleashed Teleport"):
-        return _fetch_pixmap(UNLEASHED_TP_WIKI_URL)
+        return [UNLEASHED_TP_WIKI_URL]
     filename = SUMMONER_SPELLS.get(spell_name)
     if not filename:
-        return None
-    url = f"https://ddragon.leagueoflegends.com/cdn/{version}/img/spell/{filename}"
-    return _fetch_pixmap(url)
+        return []
+    return [f"https://ddragon.leagueoflegends.com/cdn/{version}/img/spell/{filename}"]
 
 # Lucidity Boots (item 3158) + Cosmic Insight rune (wiki URL)
-def get_lucidity_icon(version):
-    url = f"https://ddragon.leagueoflegends.com/cdn/{version}/img/item/3158.png"
-    return _fetch_pixmap(url)
+def lucidity_icon_url(version):
+    return f"https://ddragon.leagueoflegends.com/cdn/{version}/img/item/3158.png"
+
+COSMIC_ICON_URL = "https://wiki.leagueoflegends.com/en-us/images/Cosmic_Insight_rune.png?004b5"
 
-def get_cosmic_icon():
-    wiki_url = "https://wiki.leagueoflegends.com/en-us/images/Cosmic_Insight_rune.png?004b5"
-    return _fetch_pixmap(wiki_url)
+# Toolbar icon for the Game Configuration button
+CONFIG_ICON_URL = "https://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/default/v1/champion-icons/-1.png"
 
 # Known ultimate icon overrides (when {ChampionName}R.png doesn't exist)
 ULTIMATE_ICON_OVERRIDES = {
@@ -164,36 +1080,129 @@ ULTIMATE_ICON_OVERRIDES = {
     "Zilean": "ChronoShift.png",
 }
 
-def get_ultimate_icon(champ_name, version):
+def ability_icon_url(spell, version):
+    """Icon for a championFull.json spell entry (Q/W/E)."""
+    return f"https://ddragon.leagueoflegends.com/cdn/{version}/img/spell/{spell['image']['full']}"
+
+def ultimate_icon_urls(champ_name, version):
+    """Candidate URLs in order: {ChampionName}R.png, then the known override."""
     base = f"https://ddragon.leagueoflegends.com/cdn/{version}/img/spell/"
-    pm = _fetch_pixmap(f"{base}{champ_name}R.png")
-    if pm:
-        return pm
+    urls = [f"{base}{champ_name}R.png"]
     override = ULTIMATE_ICON_OVERRIDES.get(champ_name)
     if override:
-        pm = _fetch_pixmap(f"{base}{override}")
-        if pm:
-            return pm
-    return None
+        urls.append(f"{base}{override}")
+    return urls
 
 # JSON data safe to fetch pre-QApplication
 champion_data = get_champion_data()
 dd_version = get_latest_version()
 
 # ----------------------------
-# Name mapping helpers (Wukong <-> MonkeyKing)
+# Locale packs (player-facing names per language)
 # ----------------------------
+DEFAULT_LOCALE = "en_US"  # Built in: internal names are English (plus the Wukong alias below)
+LOCALES = (
+    "en_US", "cs_CZ", "de_DE", "el_GR", "es_ES", "es_MX", "fr_FR", "hu_HU", "it_IT", "ja_JP",
+    "ko_KR", "pl_PL", "pt_BR", "ro_RO", "ru_RU", "th_TH", "tr_TR", "vi_VN", "zh_CN", "zh_TW",
+)
+LOCALE = os.environ.get("SUMMONER_TRACKER_LOCALE", DEFAULT_LOCALE)
+
+# Single loader thread: packs are fetched/parsed off the GUI thread, one at a time
+_locale_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="locale")
+
+class LocalePacks:
+    """
+    Display names per language, fetched on first use and cached compactly as
+    locales/<version>/<locale>.json: champion and summoner names from the language's summary
+    files, plus ability names only for champions that have been on a row. Packs load on the
+    locale thread; `activate` swaps one in on the GUI thread.
+    """
+    def __init__(self, version):
+        self.version = version
+        self.locale = DEFAULT_LOCALE
+        self.active = None  # pack of the active locale; None = built-in English
+        self._packs = {}
+        self._reverse = {}  # display name -> internal champion name, for the active pack
+
+    def _path(self, locale):
+        return _cache_path("locales", self.version, f"{locale}.json")
+
+    def _save(self, locale, pack):
+        _write_atomic(self._path(locale), json.dumps(pack, ensure_ascii=False, separators=(",", ":")).encode())
+
+    def _download(self, locale):
+        base = f"{DDRAGON_CDN}{self.version}/data/{locale}/"
+        champions = _get_json(base + "champion.json")["data"]
+        summoners = _get_json(base + "summoner.json")["data"]
+        stems = {name: filename.rsplit(".", 1)[0] for name, filename in SUMMONER_SPELLS.items()}
+        pack = {
+            "champions": {champ_id: entry["name"] for champ_id, entry in champions.items()},
+            "summoners": {name: summoners[stem]["name"] for name, stem in stems.items() if stem in summoners},
+            "spells": {},  # champion -> [Q, W, E, R] names, filled per champion on demand
+        }
+        self._save(locale, pack)
+        directory = os.path.dirname(self._path(locale))
+        for name in os.listdir(os.path.dirname(directory)):  # packs of older patches
+            if name != self.version:
+                shutil.rmtree(os.path.join(os.path.dirname(directory), name), ignore_errors=True)
+        return pack
+
+    def load(self, locale, champs=()):
+        """Pack for `locale` with ability names for `champs` (blocking); None if unavailable."""
+        try:
+            pack = self._packs.get(locale)
+            if pack is None:
+                data = _read_cached(self._path(locale))
+                pack = json.loads(data) if data else self._download(locale)
+                self._packs[locale] = pack
+            missing = [c for c in champs if c and c not in pack["spells"]]
+            for champ in missing:
+                url = f"{DDRAGON_CDN}{self.version}/data/{locale}/champion/{champ}.json"
+                spells = _get_json(url)["data"][champ]["spells"]
+                pack["spells"][champ] = [sp["name"] for sp in spells]
+            if missing:
+                self._save(locale, pack)
+            return pack
+        except HostUnavailable:
+            return self._packs.get(locale)
+        except Exception as e:
+            print(f"Error loading locale pack {locale}:", e)
+            return self._packs.get(locale)
+
+    def activate(self, locale):
+        """Make `locale` the display language (GUI thread; its pack must be loaded)."""
+        self.locale = locale
+        self.active = self._packs.get(locale) if locale != DEFAULT_LOCALE else None
+        self._reverse = {name: champ for champ, name in self.active["champions"].items()} if self.active else {}
+
+locales = LocalePacks(dd_version)
+
 def to_display_champ(name: str) -> str:
+    if locales.active:
+        return locales.active["champions"].get(name, name)
     return "Wukong" if name == "MonkeyKing" else name
 
 def to_internal_champ(name: str) -> str:
+    if locales.active:
+        return locales._reverse.get(name, name)
     return "MonkeyKing" if name == "Wukong" else name
 
+def to_display_spell(name: str) -> str:
+    """Summoner spell name in the active locale (internal names are English)."""
+    return locales.active["summoners"].get(name, name) if locales.active else name
+
+def ability_name(champ, slot):
+    """Q/W/E/R spell name in the active locale, or None if it has not been loaded."""
+    index = "QWER".index(slot)
+    if locales.active:
+        names = locales.active["spells"].get(champ, [])
+    else:
+        names = [sp["name"] for sp in champion_data.get("data", {}).get(champ, {}).get("spells", [])]
+    return names[index] if index < len(names) else None
+
 def get_display_champion_list():
-    internal = sorted(list(champion_data.get("data", {}).keys()))
-    # Replace MonkeyKing with Wukong for player-facing list
-    display = [to_display_champ(n) for n in internal]
-    return display
+    # Player-facing names (Wukong, or the active locale's names), in that language's order
+    return sorted((to_display_champ(n) for n in champion_data.get("data", {})), key=str.casefold)
 
 # ----------------------------
 # Cooldown helpers
@@ -201,10 +1210,746 @@ def get_display_champion_list():
 def ability_haste_to_cdr_percent(haste):
     return haste / (haste + 100)
 
-def get_ultimate_cooldowns(champion_name):
-    if champion_name not in champion_data.get("data", {}):
-        return [100, 80, 60]  # fallback
-    return champion_data["data"][champion_name]["spells"][-1]["cooldown"]
+def get_ability_cooldowns(champion_name):
+    """Base cooldown per rank for Q/W/E/R; unknown champions only get fallback ultimate values."""
+    spells = champion_data.get("data", {}).get(champion_name, {}).get("spells", [])
+    if len(spells) < 4:
+        return {"R": (100, 80, 60)}  # fallback
+    return {slot: tuple(sp["cooldown"]) for slot, sp in zip("QWER", spells)}
+
+def infer_ability_ranks(level):
+    """
+    (Q, W, E, R) ranks at `level`, assuming the usual order: R at 6/11/16, one point in each
+    basic ability first, then max Q, then W, then E (a basic can't pass rank (level + 1) // 2).
+    """
+    r = 3 if level >= 16 else 2 if level >= 11 else 1 if level >= 6 else 0
+    points = level - r
+    cap = min(5, (level + 1) // 2)
+    ranks = [0, 0, 0]
+    for i in range(3):
+        if points:
+            ranks[i] = 1
+            points -= 1
+    for i in range(3):
+        add = min(points, cap - ranks[i])
+        ranks[i] += add
+        points -= add
+    return tuple(ranks) + (r,)
+
+# Indexed by level - 1; an ability press reads its inferred rank from here
+ABILITY_RANKS = tuple(infer_ability_ranks(level) for level in range(1, 19))
+
+# Summoner spell haste granted by the per-row toggles
+LUCIDITY_SUMMONER_HASTE = 10
+COSMIC_SUMMONER_HASTE = 18
+MAX_LEVEL = 18
+
+# Base summoner cooldowns (seconds), used only when summoner.json is unavailable
+FALLBACK_SUMMONER_CDS = {
+    "Flash": 300, "Teleport": 300,
+    "Clarity": 240, "Cleanse": 240, "Exhaust": 240,
+    "Ghost": 240, "Heal": 240, "Barrier": 180,
+    "Ignite": 180, "Smite": 90,
+}
+
+def unleashed_teleport_cd(level):
+    # Unleashed Teleport scales 330 (lvl1) → 240 (lvl10+), step -10 per level
+    return max(330 - (level - 1) * 10, 240)
+
+def _summoner_base_cds(summoner_json):
+    """Per-level base cooldowns for every selectable spell (+ U. Teleport)."""
+    by_key = summoner_json.get("data", {})
+    bases = {}
+    for name, filename in SUMMONER_SPELLS.items():
+        entry = by_key.get(filename.rsplit(".", 1)[0], {})
+        cds = entry.get("cooldown") or [FALLBACK_SUMMONER_CDS.get(name, 300)]
+        bases[name] = [cds[0]] * MAX_LEVEL
+    bases["U. Teleport"] = [unleashed_teleport_cd(lvl) for lvl in range(1, MAX_LEVEL + 1)]
+    return bases
+
+def build_summoner_cd_table(summoner_json):
+    """
+    Precompute final cooldowns for every (spell, level, lucidity, cosmic) combination.
+    Each spell maps to a flat tuple indexed by summoner_cd_index().
+    """
+    table = {}
+    for name, per_level in _summoner_base_cds(summoner_json).items():
+        flat = []
+        for base in per_level:
+            for lucidity in (False, True):
+                for cosmic in (False, True):
+                    haste = LUCIDITY_SUMMONER_HASTE * lucidity + COSMIC_SUMMONER_HASTE * cosmic
+                    flat.append(int(base * 100 / (100 + haste)))
+        table[name] = tuple(flat)
+    return table
+
+def summoner_cd_index(level, lucidity, cosmic):
+    return (level - 1) * 4 + lucidity * 2 + cosmic
+
+# Built once per patch; each press is a single indexed read
+summoner_cd_table = build_summoner_cd_table(get_summoner_data(dd_version))
+
+# ----------------------------
+# Scheduled game events (timing wheel on the game clock)
+# ----------------------------
+TP_UPGRADE_TIME = 600  # Teleport -> Unleashed Teleport
+# Objective timers (game seconds) as of OBJECTIVES_PATCH; check them when Riot moves a spawn
+OBJECTIVES_PATCH = "25.S1"
+DRAGON_SPAWN, DRAGON_RESPAWN = 300, 300  # 5:00, then 5:00 after each take
+GRUBS_SPAWN = 480                        # 8:00
+HERALD_SPAWN = 840                       # 14:00
+ATAKHAN_SPAWN = 1200                     # 20:00
+BARON_SPAWN, BARON_RESPAWN = 1500, 360   # 25:00, then 6:00 after each take
+# Objective, first spawn, respawn after it is taken (0 = no respawn)
+OBJECTIVES = (
+    ("Dragon", DRAGON_SPAWN, DRAGON_RESPAWN),
+    ("Grubs", GRUBS_SPAWN, 0),
+    ("Herald", HERALD_SPAWN, 0),
+    ("Atakhan", ATAKHAN_SPAWN, 0),
+    ("Baron", BARON_SPAWN, BARON_RESPAWN),
+)
+# Base respawn wait (seconds) by champion level, before the late-game increase
+BASE_RESPAWN = (10, 10, 12, 12, 14, 16, 20, 25, 28, 32.5, 35, 37.5, 40, 42.5, 45, 47.5, 50, 52.5)
+
+def respawn_seconds(level, game_time):
+    """Death timer: base by level, +0.425%/30s from 15:00, +0.3% from 30:00, +1.45% from 45:00 (max +50%)."""
+    minutes = game_time / 60
+    if minutes < 15:
+        increase = 0
+    elif minutes < 30:
+        increase = math.ceil(2 * (minutes - 15)) * 0.00425
+    elif minutes < 45:
+        increase = 0.1275 + math.ceil(2 * (minutes - 30)) * 0.003
+    else:
+        increase = 0.2175 + math.ceil(2 * (minutes - 45)) * 0.0145
+    return int(BASE_RESPAWN[level - 1] * (1 + min(increase, 0.5)))
+
+WHEEL_SLOTS = 64  # One slot per game second; later events wait in their slot for the next lap
+
+class TimingWheel:
+    """
+    Hashed timing wheel keyed on whole game seconds. schedule/cancel are O(1) and advancing the
+    clock visits one slot per elapsed second (at most one lap), so the per-tick cost does not
+    depend on how many events are pending. Events fire once their deadline has passed, so a
+    skipped or late tick only delays them to the next advance.
+    """
+    def __init__(self, slots=WHEEL_SLOTS):
+        self.slots = [[] for _ in range(slots)]
+        self.now = 0  # last game second processed
+
+    def schedule(self, at, callback, *args):
+        """Run callback(*args) once the game clock reaches `at`; returns a handle for cancel()."""
+        entry = [max(at, self.now + 1), callback, args, True]
+        self.slots[entry[0] % len(self.slots)].append(entry)
+        return entry
+
+    @staticmethod
+    def cancel(entry):
+        if entry:
+            entry[3] = False  # dropped lazily when its slot is visited
+
+    def advance(self, to):
+        """Fire everything due up to game second `to`, in deadline order."""
+        if to <= self.now:
+            self.now = min(self.now, to)  # clock set back (restore): pending events stay scheduled
+            return
+        n = len(self.slots)
+        due = []
+        for second in range(max(self.now + 1, to - n + 1), to + 1):
+            slot = self.slots[second % n]
+            if slot:
+                keep = [e for e in slot if e[3] and e[0] > to]
+                due += [e for e in slot if e[3] and e[0] <= to]
+                slot[:] = keep
+        self.now = to
+        for entry in sorted(due, key=lambda e: e[0]):
+            entry[1](*entry[2])
+
+# ----------------------------
+# Session snapshot (crash-safe restore)
+# ----------------------------
+SESSION_FILE = "session.bin"
+SNAPSHOT_INTERVAL_MS = 2000   # How often the tracker state is captured
+SNAPSHOT_MAX_AGE = 3600       # Seconds; older snapshots belong to a finished game and are ignored
+# Snapshot keys that outlive a game; the rest (clock, rows, objectives, presses) only survive a crash
+SESSION_SETTINGS = ("low_power", "theme", "crest_opacity", "window_opacity", "keep_on_top",
+                    "track_abilities", "locale")
+
+# Single writer thread keeps snapshot I/O off the GUI thread and in order
+_snapshot_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot")
+
+def _write_session_snapshot(state, name):
+    try:
+        blob = zlib.compress(json.dumps(state, separators=(",", ":")).encode())
+        _write_atomic(_cache_path(name), blob)
+    except Exception as e:
+        print("Error writing session snapshot:", e)
+
+def save_session_snapshot(state, name=SESSION_FILE):
+    """Queue `state` (a fresh, JSON-safe dict) for an atomic write on the snapshot thread."""
+    _snapshot_writer.submit(_write_session_snapshot, state, name)
+
+def _remove_session_snapshot(name):
+    try:
+        os.remove(_cache_path(name))
+    except OSError:
+        pass
+
+def remove_session_snapshot(name=SESSION_FILE):
+    """Delete the snapshot, after any write still queued for it."""
+    _snapshot_writer.submit(_remove_session_snapshot, name)
+
+def load_session_snapshot(name=SESSION_FILE):
+    """
+    The saved state to resume. The game itself is only resumed after a crash (no "clean" flag)
+    within SNAPSHOT_MAX_AGE; otherwise its presses are archived and only the settings come back.
+    """
+    try:
+        with open(_cache_path(name), "rb") as f:
+            state = json.loads(zlib.decompress(f.read()))
+    except (OSError, ValueError, zlib.error):
+        return None
+    if state.get("clean") or time.time() - state.get("saved_at", 0) > SNAPSHOT_MAX_AGE:
+        # Finished game: keep its presses for analysis, then keep only the settings
+        lineup = [row["champ"] for row in state.get("rows", [])]
+        event_store.add_game(lineup, state.get("game_events", []), state.get("game_started_at", 0))
+        state = {key: state[key] for key in SESSION_SETTINGS if key in state}
+        state["saved_at"] = time.time()
+        _write_session_snapshot(dict(state, clean=True), name)  # archived once, even if we crash next
+    return state
+
+# ----------------------------
+# Game analytics (columnar event store)
+# ----------------------------
+try:
+    import numpy as np  # optional: vectorized aggregations (pure-Python fallback otherwise)
+except ImportError:
+    np = None
+
+GAMES_DIR = "games"
+CHUNK_MAX_EVENTS = 65536  # Events per chunk file; a recorded game never spans two chunks
+CHUNK_MAGIC = b"LCG1"
+# Column name -> array typecode (numpy reads the same codes); values are native-endian
+EVENT_COLUMNS = (("game", "I"), ("t", "i"), ("champ", "H"), ("spell", "H"), ("synced", "B"))
+GAME_PHASES = (("Early", 0), ("Mid", 840), ("Late", 1680))  # Phase name, start (game seconds)
+
+class EventChunk:
+    """
+    A block of press events stored as parallel typed columns. Champions and spell keys are
+    dictionary-encoded per chunk; `game` indexes `games` ({"started_at", "lineup"}).
+    """
+    def __init__(self, champs=(), spells=(), games=()):
+        self.champs = list(champs)
+        self.spells = list(spells)
+        self.games = list(games)
+        self.columns = {name: array(code) for name, code in EVENT_COLUMNS}
+        self._codes = {"champs": {c: i for i, c in enumerate(self.champs)},
+                       "spells": {s: i for i, s in enumerate(self.spells)}}
+
+    def __len__(self):
+        return len(self.columns["t"])
+
+    def _code(self, table, name):
+        codes = self._codes[table]
+        if name not in codes:
+            codes[name] = len(codes)
+            getattr(self, table).append(name)
+        return codes[name]
+
+    def add_game(self, lineup, events, started_at=0):
+        """Append one game: `events` are [game_time, champion, countdown key, synced] lists."""
+        game = len(self.games)
+        self.games.append({"started_at": started_at, "lineup": list(lineup)})
+        cols = self.columns
+        for t, champ, key, synced in events:
+            cols["game"].append(game)
+            cols["t"].append(t)
+            cols["champ"].append(self._code("champs", champ))
+            cols["spell"].append(self._code("spells", key))
+            cols["synced"].append(bool(synced))
+
+    def spell_code(self, key):
+        return self._codes["spells"].get(key)
+
+    def arrays(self):
+        """Columns as numpy views over the same buffers (no copy); only called when numpy exists."""
+        return {name: np.frombuffer(col, dtype=code) if len(col) else np.zeros(0, dtype=code)
+                for (name, code), col in zip(EVENT_COLUMNS, self.columns.values())}
+
+    def to_bytes(self):
+        header = json.dumps({"rows": len(self), "champs": self.champs, "spells": self.spells,
+                             "games": self.games}, separators=(",", ":")).encode()
+        return b"".join([CHUNK_MAGIC, struct.pack("<I", len(header)), header]
+                        + [col.tobytes() for col in self.columns.values()])
+
+    @classmethod
+    def from_bytes(cls, data):
+        if data[:4] != CHUNK_MAGIC:
+            raise ValueError("not an event chunk")
+        (hlen,) = struct.unpack_from("<I", data, 4)
+        header = json.loads(data[8:8 + hlen])
+        chunk = cls(header["champs"], header["spells"], header["games"])
+        offset = 8 + hlen
+        for name, code in EVENT_COLUMNS:
+            col = chunk.columns[name]
+            size = header["rows"] * col.itemsize
+            col.frombytes(data[offset:offset + size])
+            offset += size
+        return chunk
+
+# Single worker for reading recorded games (analysis, prefetch warmup) off the GUI thread
+_history_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history")
+
+class EventStore:
+    """
+    Append-only chunk files under CACHE_DIR/games; chunks are read once and kept in memory.
+    Thread-safe: the history worker reads while the GUI thread archives games.
+    """
+    def __init__(self):
+        self._loaded = {}  # path -> (mtime, EventChunk)
+        self._lock = threading.RLock()
+
+    def _paths(self):
+        directory = os.path.dirname(_cache_path(GAMES_DIR, "x"))
+        return [os.path.join(directory, n) for n in sorted(os.listdir(directory)) if n.endswith(".lcg")]
+
+    def _load(self, path):
+        """The chunk stored at `path` (cached by mtime), or None if it cannot be read."""
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return None
+        cached = self._loaded.get(path)
+        if not cached or cached[0] != mtime:
+            try:
+                with open(path, "rb") as f:
+                    chunk = EventChunk.from_bytes(f.read())
+            except (OSError, ValueError, KeyError, struct.error) as e:
+                print(f"Skipping unreadable game chunk {path}: {e}")
+                chunk = None  # remembered too, so it is reported once per change
+            cached = self._loaded[path] = (mtime, chunk)
+        return cached[1]
+
+    def chunks(self):
+        with self._lock:
+            return [chunk for chunk in map(self._load, self._paths()) if chunk is not None]
+
+    def add_game(self, lineup, events, started_at=0):
+        """Persist one finished game (no-op without events). An unreadable last file is left alone."""
+        if not events:
+            return
+        with self._lock:
+            paths = self._paths()
+            chunk = self._load(paths[-1]) if paths else None
+            if chunk is None or len(chunk) + len(events) > CHUNK_MAX_EVENTS:
+                chunk = EventChunk()
+                path = _cache_path(GAMES_DIR, f"{len(paths):05d}.lcg")
+            else:
+                path = paths[-1]
+            chunk.add_game(lineup, events, started_at)
+            _write_atomic(path, chunk.to_bytes())
+            self._loaded[path] = (os.path.getmtime(path), chunk)
+
+event_store = EventStore()
+
+def _merge(totals, names, values):
+    for name, value in zip(names, values):
+        totals[name] = totals.get(name, 0) + value
+
+def popular_champions(chunks, top):
+    """The `top` champions seen in the most recorded lineups."""
+    picks = {}
+    for chunk in chunks:
+        for game in chunk.games:
+            _merge(picks, game["lineup"], itertools.repeat(1))
+    return sorted(picks, key=picks.get, reverse=True)[:top]
+
+def presses_per_game(chunks, key):
+    """{champion: presses of `key` per game that champion was in the lineup}."""
+    presses, games = {}, {}
+    for chunk in chunks:
+        for game in chunk.games:
+            _merge(games, set(game["lineup"]), itertools.repeat(1))
+        code = chunk.spell_code(key)
+        if code is None:
+            continue
+        if np is not None:
+            cols = chunk.arrays()
+            counts = np.bincount(cols["champ"][cols["spell"] == code], minlength=len(chunk.champs))
+        else:
+            counts = [0] * len(chunk.champs)
+            for champ, spell in zip(chunk.columns["champ"], chunk.columns["spell"]):
+                if spell == code:
+                    counts[champ] += 1
+        _merge(presses, chunk.champs, counts)
+    return {c: n / games[c] for c, n in presses.items() if n and games.get(c)}
+
+def mean_press_interval(chunks, key="ult"):
+    """{champion: average seconds between consecutive presses of `key` within one game}."""
+    sums, counts = {}, {}
+    for chunk in chunks:
+        code = chunk.spell_code(key)
+        if code is None:
+            continue
+        if np is not None:
+            cols = chunk.arrays()
+            mask = cols["spell"] == code
+            g, c, t = cols["game"][mask], cols["champ"][mask], cols["t"][mask]
+            order = np.lexsort((t, c, g))
+            g, c, t = g[order], c[order], t[order]
+            same = (g[1:] == g[:-1]) & (c[1:] == c[:-1])
+            champs = c[1:][same]
+            n = len(chunk.champs)
+            chunk_sums = np.bincount(champs, weights=np.diff(t)[same], minlength=n)
+            chunk_counts = np.bincount(champs, minlength=n)
+        else:
+            cols = chunk.columns
+            rows = sorted((g, c, t) for g, c, t, s in zip(cols["game"], cols["champ"], cols["t"], cols["spell"])
+                          if s == code)
+            chunk_sums = [0] * len(chunk.champs)
+            chunk_counts = [0] * len(chunk.champs)
+            for (g0, c0, t0), (g1, c1, t1) in zip(rows, rows[1:]):
+                if g0 == g1 and c0 == c1:
+                    chunk_sums[c1] += t1 - t0
+                    chunk_counts[c1] += 1
+        _merge(sums, chunk.champs, chunk_sums)
+        _merge(counts, chunk.champs, chunk_counts)
+    return {c: sums[c] / n for c, n in counts.items() if n}
+
+def presses_by_phase(chunks):
+    """{countdown key: [presses per GAME_PHASES entry]}."""
+    starts = [start for _, start in GAME_PHASES]
+    totals = {}
+    for chunk in chunks:
+        phases = len(starts)
+        if np is not None:
+            cols = chunk.arrays()
+            phase = np.searchsorted(np.array(starts), cols["t"], side="right") - 1
+            flat = np.bincount(cols["spell"].astype(np.int64) * phases + phase,
+                               minlength=len(chunk.spells) * phases)
+            per_spell = flat.reshape(-1, phases).tolist()
+        else:
+            per_spell = [[0] * phases for _ in chunk.spells]
+            for spell, t in zip(chunk.columns["spell"], chunk.columns["t"]):
+                per_spell[spell][sum(t >= s for s in starts) - 1] += 1
+        for key, counts in zip(chunk.spells, per_spell):
+            acc = totals.setdefault(key, [0] * phases)
+            for i, n in enumerate(counts):
+                acc[i] += n
+    return totals
+
+def _spell_label(key):
+    return "R" if key == "ult" else key.split(":", 1)[1]
+
+def analysis_report(chunks, top=8):
+    """Plain-text summary of the given chunks (one game or the whole history)."""
+    started = time.perf_counter()
+    games = sum(len(c.games) for c in chunks)
+    events = sum(len(c) for c in chunks)
+    if not events:
+        return "No presses recorded yet."
+    lines = []
+    flash = sorted(presses_per_game(chunks, "summoner:Flash").items(), key=lambda kv: -kv[1])[:top]
+    lines.append("Flash per game:")
+    lines += [f"  {to_display_champ(c):<14}{v:5.2f}" for c, v in flash] or ["  –"]
+    ults = sorted(mean_press_interval(chunks, "ult").items(), key=lambda kv: kv[1])[:top]
+    lines.append("Average time between ultimates:")
+    lines += [f"  {to_display_champ(c):<14}{int(v) // 60:3d}:{int(v) % 60:02d}" for c, v in ults] or ["  –"]
+    phases = sorted(presses_by_phase(chunks).items(), key=lambda kv: -sum(kv[1]))[:top]
+    lines.append("Presses by phase:  " + "".join(f"{name:>7}" for name, _ in GAME_PHASES))
+    lines += [f"  {_spell_label(k):<17}" + "".join(f"{n:7d}" for n in v) for k, v in phases]
+    elapsed = (time.perf_counter() - started) * 1000
+    lines.insert(0, f"{games} game(s), {events} presses ({elapsed:.0f} ms{'' if np is not None else ', no numpy'})")
+    return "\n".join(lines)
+
+# ----------------------------
+# Push server (optional): live timer state for overlays / second screens
+# ----------------------------
+PUSH_SERVER_PORT = int(os.environ.get("SUMMONER_TRACKER_PUSH_PORT", "0"))  # 0 disables the server
+PUSH_SERVER_HOST = os.environ.get("SUMMONER_TRACKER_PUSH_HOST", "127.0.0.1")  # 0.0.0.0 = reachable on the LAN
+PUSH_SERVER_TOKEN = os.environ.get("SUMMONER_TRACKER_PUSH_TOKEN", "")  # Required (?token=...) when not bound to loopback
+WS_MAX_MESSAGE = 65536  # Largest client message (after reassembling fragments)
+PUSH_QUEUE_LIMIT = 64  # Frames buffered per subscriber before it is resynced with a snapshot
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+def _ws_frame(payload: bytes, opcode=0x1):
+    """Single unmasked server->client WebSocket frame (FIN set)."""
+    n = len(payload)
+    if n < 126:
+        header = struct.pack("!BB", 0x80 | opcode, n)
+    elif n < 65536:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, n)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+    return header + payload
+
+async def _ws_read_frame(reader):
+    """Return (fin, opcode, payload) of the next client frame, unmasking it."""
+    b1, b2 = await reader.readexactly(2)
+    n = b2 & 0x7F
+    if n == 126:
+        n = struct.unpack("!H", await reader.readexactly(2))[0]
+    elif n == 127:
+        n = struct.unpack("!Q", await reader.readexactly(8))[0]
+    if n > WS_MAX_MESSAGE:
+        raise ValueError("frame too large")
+    mask = await reader.readexactly(4) if b2 & 0x80 else b"\0\0\0\0"
+    data = await reader.readexactly(n)
+    return bool(b1 & 0x80), b1 & 0x0F, bytes(b ^ mask[i % 4] for i, b in enumerate(data))
+
+def _ws_close_frame(code):
+    return _ws_frame(struct.pack("!H", code), 0x8)
+
+def _is_loopback(host):
+    return host in ("localhost", "::1") or host.startswith("127.")
+
+def _rpc(method, params):
+    return json.dumps({"jsonrpc": "2.0", "method": method, "params": params}, separators=(",", ":")).encode()
+
+def _rpc_result(msg_id, result):
+    return json.dumps({"jsonrpc": "2.0", "id": msg_id, "result": result}, separators=(",", ":")).encode()
+
+class _Subscriber:
+    def __init__(self, writer):
+        self.writer = writer
+        self.queue = asyncio.Queue(maxsize=PUSH_QUEUE_LIMIT)
+        self.resync = False
+
+    def push(self, frame):
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self.resync = True  # too far behind: drop the backlog and send a fresh snapshot
+
+class PushServer:
+    """
+    WebSocket server on its own asyncio thread. The GUI publishes a flat {path: value} view of
+    the tracker; the server diffs it against the last one and sends only changed paths as a
+    JSON-RPC "delta" notification (removed paths are null). New subscribers get a "snapshot"
+    first and can request one again with {"method": "snapshot", "id": ...}. A plain HTTP GET
+    returns the current snapshot as JSON. When a token is set, every request must carry it
+    as ?token=...; the server refuses to listen beyond loopback without one.
+    """
+    def __init__(self, host, port, token="", on_subscribers=None):
+        self.host = host
+        self.port = port
+        self.token = token
+        self.on_subscribers = on_subscribers  # called (server thread) when a subscriber joins or leaves
+        self.loop = asyncio.new_event_loop()
+        self._started = False
+        self._state = {}
+        self._subscribers = set()
+
+    def start(self):
+        """Bind, then serve on a thread. False (and nothing running) if it could not listen."""
+        if not self.token and not _is_loopback(self.host):
+            print(f"Push server not started: set SUMMONER_TRACKER_PUSH_TOKEN to listen on {self.host}")
+            return False
+        try:
+            self.loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port))
+        except OSError as e:
+            print("Error starting push server:", e)
+            self.loop.close()
+            return False
+        self._started = True
+        threading.Thread(target=self.loop.run_forever, name="push-server", daemon=True).start()
+        return True
+
+    @property
+    def has_subscribers(self):
+        return bool(self._subscribers)
+
+    def publish(self, state):
+        """GUI thread: hand over the latest state; diffing and fan-out happen on the server loop."""
+        if self._started:
+            self.loop.call_soon_threadsafe(self._broadcast, state)
+
+    def _subscribers_changed(self):
+        if self.on_subscribers:
+            self.on_subscribers()
+
+    def _broadcast(self, state):
+        old = self._state
+        delta = {k: v for k, v in state.items() if k not in old or old[k] != v}
+        delta.update({k: None for k in old if k not in state})
+        self._state = state
+        if not delta:
+            return
+        frame = _ws_frame(_rpc("delta", delta))  # encoded once for every subscriber
+        for sub in self._subscribers:
+            sub.push(frame)
+
+    async def _sender(self, sub):
+        try:
+            while True:
+                frame = await sub.queue.get()
+                if sub.resync:
+                    sub.resync = False
+                    while not sub.queue.empty():
+                        sub.queue.get_nowait()
+                    frame = _ws_frame(_rpc("snapshot", self._state))
+                sub.writer.write(frame)
+                await sub.writer.drain()
+        except (ConnectionError, OSError):
+            pass
+
+    async def _handle(self, reader, writer):
+        try:
+            request = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), 5)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            writer.close()
+            return
+        lines = request.decode("latin-1").split("\r\n")
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if self.token:
+            target = lines[0].split(" ")[1] if lines[0].count(" ") >= 2 else ""
+            given = parse_qs(urlsplit(target).query).get("token", [""])[0]
+            if not hmac.compare_digest(given.encode(), self.token.encode()):
+                writer.write(b"HTTP/1.1 401 Unauthorized\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+                try:
+                    await writer.drain()
+                finally:
+                    writer.close()
+                return
+
+        key = headers.get("sec-websocket-key")
+        if not key:
+            body = json.dumps(self._state).encode()
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Access-Control-Allow-Origin: *\r\nConnection: close\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+            )
+            try:
+                await writer.drain()
+            finally:
+                writer.close()
+            return
+
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+        writer.write((
+            "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n\r\n"
+        ).encode())
+        sub = _Subscriber(writer)
+        sub.push(_ws_frame(_rpc("snapshot", self._state)))
+        self._subscribers.add(sub)
+        self._subscribers_changed()
+        sender = self.loop.create_task(self._sender(sub))
+        message, message_op = None, None  # data message being reassembled from fragments
+        try:
+            while True:
+                fin, opcode, payload = await _ws_read_frame(reader)
+                if opcode == 0x8:    # close
+                    break
+                if opcode == 0x9:    # ping -> pong (control frames may arrive between fragments)
+                    sub.push(_ws_frame(payload, 0xA))
+                    continue
+                if opcode == 0xA:    # pong
+                    continue
+                if opcode == 0x0:    # continuation
+                    if message is None:
+                        raise ValueError("continuation without a message")
+                    message += payload
+                elif opcode in (0x1, 0x2) and message is None:
+                    message, message_op = payload, opcode
+                else:
+                    raise ValueError(f"unexpected opcode {opcode}")
+                if len(message) > WS_MAX_MESSAGE:
+                    writer.write(_ws_close_frame(1009))  # message too big
+                    break
+                if fin:
+                    if message_op != 0x1:
+                        writer.write(_ws_close_frame(1003))  # binary data is not accepted
+                        break
+                    self._handle_rpc(sub, message)  # JSON-RPC request
+                    message = None
+        except ValueError:
+            writer.write(_ws_close_frame(1002))  # protocol error
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._subscribers.discard(sub)
+            self._subscribers_changed()
+            sender.cancel()
+            writer.close()
+
+    def _handle_rpc(self, sub, payload):
+        try:
+            msg = json.loads(payload)
+        except ValueError:
+            return
+        if isinstance(msg, dict) and msg.get("method") == "snapshot":
+            sub.push(_ws_frame(_rpc_result(msg.get("id"), self._state)))
+
+# ----------------------------
+# Teammate sync (optional): share presses between trackers over UDP multicast
+# ----------------------------
+SYNC_GROUP = os.environ.get("SUMMONER_TRACKER_SYNC", "")     # "239.255.77.77:47777"; empty disables sync
+SYNC_ROOM = os.environ.get("SUMMONER_TRACKER_SYNC_ROOM", "")  # Keeps several teams on one LAN apart
+
+SYNC_MAGIC = b"LCT1"
+# magic, room, sender id, spell code, pressed_at stamp, ready_at (game seconds), champion
+SYNC_PACKET = struct.Struct("!4sHIBii16s")
+
+def sync_spell_keys():
+    """Countdown keys in wire order; the list index is the one-byte spell code."""
+    return (
+        ["ult"] + [f"summoner:{name}" for name in SUMMONER_SPELLS] + ["summoner:U. Teleport"]
+        + [f"ability:{slot}" for slot in "QWE"]  # appended so older trackers keep their codes
+    )
+
+def sync_slot(key):
+    """The slot a countdown key occupies: Teleport and U. Teleport are the same summoner slot."""
+    return key.replace("summoner:U. ", "summoner:")
+
+class CooldownSync:
+    """
+    Last-writer-wins replication of cooldown presses. Each press is one small datagram whose
+    times are on the game clock (the shared time base). Per (champion, slot) the press with
+    the highest (pressed_at, sender) stamp wins, so trackers converge whatever the arrival order
+    and whichever side of the 10:00 Teleport upgrade each of them is on.
+    """
+    def __init__(self, room, sender_id=None):
+        self.room = zlib.crc32(room.encode()) & 0xFFFF
+        self.sender = sender_id if sender_id is not None else int.from_bytes(os.urandom(4), "big")
+        self.keys = sync_spell_keys()
+        self._codes = {k: i for i, k in enumerate(self.keys)}
+        self.latest = {}  # (champion, sync_slot(key)) -> (pressed_at, sender)
+
+    def stamp_local(self, champ, key, game_time):
+        """Stamp a local press so it always supersedes anything already seen for that slot."""
+        slot = (champ, sync_slot(key))
+        pressed_at = max(game_time, self.latest.get(slot, (-1, 0))[0] + 1)
+        self.latest[slot] = (pressed_at, self.sender)
+        return pressed_at
+
+    def accept(self, champ, key, pressed_at, sender):
+        slot = (champ, sync_slot(key))
+        stamp = (pressed_at, sender)
+        if stamp <= self.latest.get(slot, (-1, 0)):
+            return False
+        self.latest[slot] = stamp
+        return True
+
+    def encode(self, champ, key, pressed_at, ready_at):
+        return SYNC_PACKET.pack(
+            SYNC_MAGIC, self.room, self.sender, self._codes[key], pressed_at, ready_at, champ.encode()[:16]
+        )
+
+    def decode(self, data):
+        """(champ, key, pressed_at, ready_at, sender) for a teammate's packet in our room, else None."""
+        if len(data) != SYNC_PACKET.size:
+            return None
+        magic, room, sender, code, pressed_at, ready_at, champ = SYNC_PACKET.unpack(data)
+        if magic != SYNC_MAGIC or room != self.room or sender == self.sender or code >= len(self.keys):
+            return None
+        return champ.rstrip(b"\0").decode(errors="replace"), self.keys[code], pressed_at, ready_at, sender
 
 # ----------------------------
 # Small style helper for top-right tool buttons
@@ -232,44 +1977,113 @@ def style_tool_button(btn: QPushButton, accent: str, fg: str):
 # GUI
 # ----------------------------
 class CooldownTracker(QWidget):
-    def __init__(self):
+    locale_ready = pyqtSignal(str, bool)  # locale, loaded (emitted from the locale thread)
+    analysis_ready = pyqtSignal(str, str)  # report title, text (emitted from the history thread)
+    warm_ready = pyqtSignal(list)          # champions to warm up (emitted from the history thread)
+    subscribers_changed = pyqtSignal()     # a push subscriber joined or left (emitted from the server thread)
+
+    def __init__(self, lobby=None, scheduler=None):
+        """`lobby` (1..N) and a shared `scheduler` when hosted by a LobbyWindow; None for the single-game window."""
         super().__init__()
-        self.setWindowTitle("League Cooldown Tracker")
+        self.lobby = lobby
+        self.session_file = SESSION_FILE if lobby is None else f"session-lobby{lobby}.bin"
+        self.scheduler = scheduler or TickScheduler(self)
+        self._constructed_at = time.perf_counter()  # cleared on first paint (see paintEvent)
+        self.setWindowTitle("League Cooldown Tracker" + (" (offline)" if network.offline else ""))
         self.resize(600, 200)  # launch size
 
         # Initialize theme / crest state early
         self.current_theme = "Default"
-        self.current_crest = None  # QPixmap or None
+        self.current_crest = None  # Window-sized crest variant (QPixmap) or None
+        self.current_crest_url = None
+        self._crest_is_native = False  # current_crest is the full-resolution image
+        self._crest_native_side = 0    # min(width, height) of the full-resolution crest
+        self._crest_pending = None     # crest URL being decoded off-thread
         self.crest_opacity = 0.18  # default opacity (0..1)
         self.crest_opacity_effect = None  # QGraphicsOpacityEffect set in _build_main_page
 
+        self.push_server = None  # PushServer when PUSH_SERVER_PORT is set
+        self.watchdog = stall_watchdog() if WATCHDOG else None
+        self.sync = None         # CooldownSync when SYNC_GROUP is set
+
+        # Previous session (settings; the game too after a crash), restored once pages exist
+        snapshot = load_session_snapshot(self.session_file)
+        if snapshot:
+            self.current_theme = snapshot.get("theme", self.current_theme)
+            self.crest_opacity = snapshot.get("crest_opacity", self.crest_opacity)
+        self._restore_rows = snapshot.get("rows") if snapshot else None
+        # Settings live here (not in the widgets) so the Settings page can be built lazily
+        self.low_power = bool(snapshot and snapshot.get("low_power"))  # opt-in: League usually has focus
+        self.keep_on_top = bool(snapshot and snapshot.get("keep_on_top"))
+        self.window_opacity = snapshot.get("window_opacity", 100) if snapshot else 100
+        self.track_abilities = bool(snapshot and snapshot.get("track_abilities"))  # Q/W/E columns
+        self.locale = snapshot.get("locale", LOCALE) if snapshot else LOCALE  # display language
+        self._prefetch_keys = {}  # config row index (or "warm") -> loader keys it prefetched
+        # Presses of the current game ([game_time, champion, key, synced]); archived to event_store
+        self.game_events = list(snapshot.get("game_events", [])) if snapshot else []
+        self.game_started_at = snapshot.get("game_started_at", time.time()) if snapshot else time.time()
+
         # Root layout holds a stacked layout for pages
         root_vbox = QVBoxLayout(self)
         self.pages = QStackedLayout()
         root_vbox.addLayout(self.pages)
 
-        # Build pages
+        # Build the main page now; secondary pages on first navigation or when idle (see _page)
         self.main_page = self._build_main_page()
-        self.themes_page = self._build_themes_page()
-        self.settings_page = self._build_settings_page()
-        self.config_page = self._build_game_config_page()  # Game Configuration
-
         self.pages.addWidget(self.main_page)
-        self.pages.addWidget(self.themes_page)
-        self.pages.addWidget(self.settings_page)
-        self.pages.addWidget(self.config_page)
         self.pages.setCurrentWidget(self.main_page)
+        self._page_builders = {
+            "config": self._build_game_config_page,  # Game Configuration (the heaviest)
+            "themes": self._build_themes_page,
+            "settings": self._build_settings_page,
+            "analysis": self._build_analysis_page,
+        }
+        self._built_pages = {}
+
+        if lobby is None:  # a LobbyWindow owns the window-level settings
+            self.setWindowOpacity(self.window_opacity / 100.0)
+            if self.keep_on_top:
+                self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
 
         # Apply default theme now that pages exist
         self.apply_theme(self.current_theme)
 
-        # Set the window icon to Summoner Flash
-        flash_icon = get_summoner_icon("Flash", dd_version)
-        if flash_icon:
-            icon = QIcon(flash_icon.scaled(ICON_SIZE, ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            self.setWindowIcon(icon)
+        # Set the window icon to Summoner Flash (once decoded off-thread)
+        for url in summoner_icon_urls("Flash", dd_version):
+            asset_loader().request(url, ICON_SIZE, lambda pm: pm and self.setWindowIcon(QIcon(pm)))
+
+        if snapshot:
+            self._apply_session_snapshot(snapshot)
+
+        # Names in another language are swapped in once its pack has loaded
+        self.locale_ready.connect(self._on_locale_ready)
+        if self.locale != locales.locale:
+            self._request_locale(self.locale)
+
+        # Optional push server for overlays / second screens (single-game window only)
+        if PUSH_SERVER_PORT and lobby is None:
+            self.push_server = PushServer(PUSH_SERVER_HOST, PUSH_SERVER_PORT, PUSH_SERVER_TOKEN,
+                                          self.subscribers_changed.emit)
+            if self.push_server.start():
+                self.subscribers_changed.connect(self._reschedule_tick)  # hidden: tick only for subscribers
+                self._publish_state()
+            else:
+                self.push_server = None
+
+        # Optional teammate sync over UDP multicast
+        if SYNC_GROUP and lobby is None:
+            self._setup_sync()
+
+        # Periodic session snapshot (written off the GUI thread); only runs alongside the tick
+        self._last_snapshot = None
+        self.snapshot_timer = QTimer(self)
+        self.snapshot_timer.timeout.connect(self._snapshot_session)
+        self._update_game_event_labels()
+        self._reschedule_tick()
+        self.warm_ready.connect(self._queue_warmup)
 
     # --------- Page builders ---------
+    @traced()
     def _build_main_page(self) -> QWidget:
         page = QWidget()
 
@@ -298,30 +2112,35 @@ class CooldownTracker(QWidget):
         self.start_btn.clicked.connect(self.start_timer)
         top_bar.addWidget(self.start_btn)
 
+        self.new_game_btn = QPushButton("⟲")
+        self.new_game_btn.setToolTip("New game: reset the clock, cooldowns, objectives and respawns")
+        self.new_game_btn.clicked.connect(self.new_game)
+        top_bar.addWidget(self.new_game_btn)
+
         top_bar.addStretch()
 
         # Game Config button with icon fallback — NOW using TOPBTN_ICON so the styled border is visible
-        self.config_btn = QPushButton()
-        cfg_pm = _fetch_pixmap("https://raw.communitydragon.org/latest/plugins/rcp-be-lol-game-data/global/default/v1/champion-icons/-1.png")
-        if cfg_pm:
-            self.config_btn.setIcon(QIcon(cfg_pm))
-            self.config_btn.setIconSize(QSize(TOPBTN_ICON, TOPBTN_ICON))
-        else:
-            self.config_btn.setText("📝")
+        self.config_btn = QPushButton("📝")
+        self._load_icon(self.config_btn, [CONFIG_ICON_URL], TOPBTN_ICON)
         self.config_btn.setToolTip("Game Configuration")
-        self.config_btn.clicked.connect(lambda: self.pages.setCurrentWidget(self.config_page))
+        self.config_btn.clicked.connect(lambda: self.pages.setCurrentWidget(self._page("config")))
         top_bar.addWidget(self.config_btn)
 
         self.themes_btn = QPushButton("🎨")
         self.themes_btn.setToolTip("Themes")
-        self.themes_btn.clicked.connect(lambda: self.pages.setCurrentWidget(self.themes_page))
+        self.themes_btn.clicked.connect(lambda: self.pages.setCurrentWidget(self._page("themes")))
         top_bar.addWidget(self.themes_btn)
 
         self.settings_btn = QPushButton("⚙")
         self.settings_btn.setToolTip("Settings")
-        self.settings_btn.clicked.connect(lambda: self.pages.setCurrentWidget(self.settings_page))
+        self.settings_btn.clicked.connect(self._show_settings_page)
         top_bar.addWidget(self.settings_btn)
 
+        self.analysis_btn = QPushButton("📊")
+        self.analysis_btn.setToolTip("Game analysis")
+        self.analysis_btn.clicked.connect(self._show_analysis_page)
+        top_bar.addWidget(self.analysis_btn)
+
         vbox.addLayout(top_bar)
 
         # Single-line cooldown log (latest press)
@@ -330,16 +2149,45 @@ class CooldownTracker(QWidget):
         vbox.addWidget(self.cd_log_label)
         self.cd_log_token = None  # which timer "owns" the log line
 
-        # Game timer (do NOT start yet)
-        self.game_time = 0  # seconds
-        self.game_timer = QTimer(self)
-        self.game_timer.timeout.connect(self.update_game_time)
+        # Objective timers: time to spawn, "up" once spawned; click when taken to start the respawn
+        objectives_bar = QHBoxLayout()
+        self.objectives = {}
+        for name, first_spawn, _ in OBJECTIVES:
+            btn = QPushButton(name)
+            btn.setToolTip(f"{name}: click when it is taken")
+            btn.clicked.connect(lambda _, n=name: self._on_objective_taken(n))
+            objectives_bar.addWidget(btn)
+            self.objectives[name] = {"btn": btn, "spawn_at": first_spawn, "handle": None}
+        objectives_bar.addStretch()
+        vbox.addLayout(objectives_bar)
+
+        # Game clock (do NOT start yet). One single-shot tick drives the clock and every countdown,
+        # and is only armed while something is running and the window is on screen.
+        self._clock_origin = None  # time.monotonic() at game time 0 while the clock runs
+        self._paused_game_time = 0
+        self._countdown_ids = itertools.count()
+        self._schedule_game_events()
+        self._tick_due = None                      # monotonic time the armed tick should fire
+        self.tick_lateness = LatencyHistogram()    # how late the tick fired, ms
 
         # Enemy grid
         self.enemy_layout = QGridLayout()
         vbox.addLayout(self.enemy_layout)
 
-        headers = ["Champ", "Lvl", "AH", "Spell 1", "CD", "Spell 2", "CD", "Ult", "CD", "", ""]
+        # Optional live instrumentation overlay (spans + counters), below the grid
+        self.trace_label = None
+        if TRACE_OVERLAY:
+            self.trace_label = QLabel("")
+            self._style_glassy_label(self.trace_label, underline=False)
+            vbox.addWidget(self.trace_label)
+            self.trace_timer = QTimer(self)
+            self.trace_timer.timeout.connect(self._update_trace_overlay)
+            self.trace_timer.start(500)
+
+        headers = [
+            "Champ", "Lvl", "AH", "Spell 1", "CD", "Spell 2", "CD",
+            "Q", "CD", "W", "CD", "E", "CD", "Ult", "CD", "", "",
+        ]
         header_font = QFont()
         header_font.setBold(True)
         for col, header in enumerate(headers):
@@ -347,10 +2195,7 @@ class CooldownTracker(QWidget):
             lbl.setFont(header_font)
             self._style_header_label(lbl)  # transparent bg + shadow
             self.enemy_layout.addWidget(lbl, 0, col)
-
-        # Load lucidity/cosmic icons (post-QApplication)
-        self.lucidity_pm = get_lucidity_icon(dd_version)
-        self.cosmic_pm = get_cosmic_icon()
+            lbl.setVisible(self.track_abilities or col not in ABILITY_COLUMNS)
 
         self.enemies = []
         # initial loadout
@@ -361,13 +2206,39 @@ class CooldownTracker(QWidget):
             {"champ": "Akshan", "s1": "Flash", "s2": "Teleport"},
             {"champ": "Alistar","s1": "Flash", "s2": "Teleport"},
         ]
-        self.setup_enemy_rows(default_rows)
+        self.setup_enemy_rows(self._restore_rows or default_rows)
 
         # Crest ordering
         self.bg_label.lower()
         self._position_background_label(page)
         return page
 
+    def _page(self, name) -> QWidget:
+        """Secondary page by name, built and added to the stack on first use."""
+        page = self._built_pages.get(name)
+        if page is None:
+            page = self._built_pages[name] = self._page_builders[name]()
+            self.pages.addWidget(page)
+        return page
+
+    def _prebuild_pages(self):
+        """Idle-time build of the pages not opened yet, one per event-loop slice."""
+        pending = [name for name in self._page_builders if name not in self._built_pages]
+        if pending:
+            self._page(pending[0])
+            if len(pending) > 1:
+                QTimer.singleShot(50, self._prebuild_pages)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._constructed_at is not None:
+            tracer.gauge("first_paint_ms", round((time.perf_counter() - self._constructed_at) * 1000, 1))
+            self._constructed_at = None
+            QTimer.singleShot(PAGE_PREBUILD_DELAY_MS, self._prebuild_pages)
+            if self.lobby in (None, 1):  # the asset cache is shared, so one warmup serves every lobby
+                QTimer.singleShot(0, self._warm_popular_champions)  # once the first frame is out
+
+    @traced()
     def _build_themes_page(self) -> QWidget:
         page = QWidget()
         vbox = QVBoxLayout(page)
@@ -416,6 +2287,7 @@ class CooldownTracker(QWidget):
         vbox.addStretch(1)
         return page
 
+    @traced()
     def _build_settings_page(self) -> QWidget:
         page = QWidget()
         vbox = QVBoxLayout(page)
@@ -432,12 +2304,12 @@ class CooldownTracker(QWidget):
         row1 = QHBoxLayout()
         lbl1 = QLabel("Window Opacity:")
         self._style_header_label(lbl1)
-        self.window_opacity_value = QLabel("1.00")
+        self.window_opacity_value = QLabel(f"{self.window_opacity / 100.0:.2f}")
         self._style_header_label(self.window_opacity_value)
 
         self.window_opacity_slider = QSlider(Qt.Horizontal)
         self.window_opacity_slider.setRange(10, 100)  # 0.10 .. 1.00
-        self.window_opacity_slider.setValue(100)
+        self.window_opacity_slider.setValue(self.window_opacity)
         self.window_opacity_slider.setSingleStep(1)
         self.window_opacity_slider.setPageStep(5)
         self.window_opacity_slider.valueChanged.connect(self._on_window_opacity_changed)
@@ -450,14 +2322,92 @@ class CooldownTracker(QWidget):
         # Keep on top toggle
         row2 = QHBoxLayout()
         self.keep_on_top_cb = QCheckBox("Keep on top (always on top)")
+        self.keep_on_top_cb.setChecked(self.keep_on_top)
         self.keep_on_top_cb.stateChanged.connect(self._on_keep_on_top_toggled)
         row2.addWidget(self.keep_on_top_cb)
         row2.addStretch()
         vbox.addLayout(row2)
 
+        # Low-power ticking: coalesce display updates while the window is behind other windows
+        row3 = QHBoxLayout()
+        self.low_power_cb = QCheckBox("Low-power mode (slower updates while behind other windows)")
+        self.low_power_cb.setChecked(self.low_power)
+        self.low_power_cb.stateChanged.connect(self._on_low_power_toggled)
+        row3.addWidget(self.low_power_cb)
+        row3.addStretch()
+        vbox.addLayout(row3)
+
+        # Basic ability (Q/W/E) timers next to the ultimate
+        row4 = QHBoxLayout()
+        self.abilities_cb = QCheckBox("Track Q/W/E abilities (right-click an ability to set its rank)")
+        self.abilities_cb.setChecked(self.track_abilities)
+        self.abilities_cb.stateChanged.connect(self._on_abilities_toggled)
+        row4.addWidget(self.abilities_cb)
+        row4.addStretch()
+        vbox.addLayout(row4)
+
+        # Display language for champion / spell names (packs load in the background)
+        row5 = QHBoxLayout()
+        lbl5 = QLabel("Language:")
+        self._style_header_label(lbl5)
+        self.locale_cb = QComboBox()
+        self.locale_cb.addItems(LOCALES)
+        self.locale_cb.setCurrentText(self.locale)
+        self.locale_cb.currentTextChanged.connect(self._on_locale_selected)
+        row5.addWidget(lbl5)
+        row5.addWidget(self.locale_cb)
+        row5.addStretch()
+        vbox.addLayout(row5)
+
+        # Decoded image memory vs. PIXMAP_BUDGET_MB (refreshed when the page is opened)
+        self.image_memory_label = QLabel("")
+        self._style_header_label(self.image_memory_label)
+        vbox.addWidget(self.image_memory_label)
+
+        # Tick jitter (and GUI stalls when the watchdog is on), refreshed when the page is opened
+        self.timing_label = QLabel("")
+        self._style_header_label(self.timing_label)
+        vbox.addWidget(self.timing_label)
+
+        vbox.addStretch(1)
+        return page
+
+    @traced()
+    def _build_analysis_page(self) -> QWidget:
+        """Post-game / cross-game summaries computed from the recorded presses."""
+        page = QWidget()
+        vbox = QVBoxLayout(page)
+
+        # Top bar: Back
+        top = QHBoxLayout()
+        back = QPushButton("◀ Back")
+        back.clicked.connect(lambda: self.pages.setCurrentWidget(self.main_page))
+        top.addWidget(back)
+        top.addStretch()
+        vbox.addLayout(top)
+
+        report_font = QFont("Monospace")
+        report_font.setStyleHint(QFont.TypeWriter)
+        self.analysis_labels = {}
+        for title in ("This game", "All recorded games"):
+            hdr = QLabel(title)
+            hdr_font = QFont()
+            hdr_font.setBold(True)
+            hdr.setFont(hdr_font)
+            self._style_header_label(hdr)
+            vbox.addWidget(hdr)
+            lbl = QLabel("")
+            lbl.setFont(report_font)
+            lbl.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            self._style_header_label(lbl)
+            vbox.addWidget(lbl)
+            self.analysis_labels[title] = lbl
+        self.analysis_ready.connect(lambda title, text: self.analysis_labels[title].setText(text))
+
         vbox.addStretch(1)
         return page
 
+    @traced()
     def _build_game_config_page(self) -> QWidget:
         """Game Configuration page with header, 5 rows × 3 columns of dropdowns, and Apply (bottom-right)."""
         page = QWidget()
@@ -491,28 +2441,33 @@ class CooldownTracker(QWidget):
             self._style_header_label(lbl)
             grid.addWidget(lbl, 0, col)
 
-        # Data sources
-        self.all_champions_display = get_display_champion_list()
-        self.all_summoners = list(SUMMONER_SPELLS.keys())
-
         # Keep references to dropdowns so we can read them on Apply
         self.config_rows = []
 
         # 5 rows of selectors
         for r in range(1, 6):
+            # Items show player-facing names and carry the internal name as data
             champ_cb = QComboBox()
-            champ_cb.addItems(self.all_champions_display)  # player-facing names
             grid.addWidget(champ_cb, r, 0)
-
             s1_cb = QComboBox()
-            s1_cb.addItems(self.all_summoners)
             grid.addWidget(s1_cb, r, 1)
-
             s2_cb = QComboBox()
-            s2_cb.addItems(self.all_summoners)
             grid.addWidget(s2_cb, r, 2)
 
-            self.config_rows.append({"champ": champ_cb, "s1": s1_cb, "s2": s2_cb})
+            cfg = {"champ": champ_cb, "s1": s1_cb, "s2": s2_cb}
+            self._fill_config_row(cfg)
+            self.config_rows.append(cfg)
+
+            # Start from the lineup on the main page (restored session or last Apply)
+            if r <= len(self.enemies):
+                row = self.enemies[r - 1]
+                champ_cb.setCurrentIndex(max(0, champ_cb.findData(row["champion"])))
+                s1_cb.setCurrentIndex(max(0, s1_cb.findData(row["summ1_name"].replace("U. ", ""))))
+                s2_cb.setCurrentIndex(max(0, s2_cb.findData(row["summ2_name"].replace("U. ", ""))))
+
+            # Start decoding the icons this selection needs before Apply is pressed
+            for cb in (champ_cb, s1_cb, s2_cb):
+                cb.currentIndexChanged.connect(lambda _, idx=r - 1: self._prefetch_config_row(idx))
 
         vbox.addLayout(grid)
 
@@ -528,16 +2483,26 @@ class CooldownTracker(QWidget):
         vbox.addStretch(1)
         return page
 
+    @staticmethod
+    def _fill_config_row(cfg):
+        """(Re)fill a config row's dropdowns in the active locale, keeping the selection and not firing signals."""
+        champions = [(name, to_internal_champ(name)) for name in get_display_champion_list()]
+        summoners = [(to_display_spell(name), name) for name in SUMMONER_SPELLS]
+        for cb, choices in ((cfg["champ"], champions), (cfg["s1"], summoners), (cfg["s2"], summoners)):
+            selected = cb.currentData()
+            cb.blockSignals(True)
+            cb.clear()
+            for text, data in choices:
+                cb.addItem(text, data)
+            cb.setCurrentIndex(max(0, cb.findData(selected)))
+            cb.blockSignals(False)
+
     # --------- Enemy rows (builder/reset) ---------
     def _clear_enemy_rows(self):
-        """Remove all current enemy rows (keep header row). Also stop timers."""
-        for row in getattr(self, "enemies", []):
-            for t in row.get("timers", {}).values():
-                try:
-                    t.stop()
-                except Exception:
-                    pass
+        """Remove all current enemy rows (keep header row). Their countdowns go with them."""
         current_rows = len(getattr(self, "enemies", []))
+        for row in getattr(self, "enemies", []):
+            self.game_events_wheel.cancel(row.get("respawn_handle"))
         cols = self.enemy_layout.columnCount()
         for i in range(1, current_rows + 1):
             for c in range(cols):
@@ -548,6 +2513,7 @@ class CooldownTracker(QWidget):
                         w.deleteLater()
         self.enemies = []
 
+    @traced()
     def setup_enemy_rows(self, rows_data):
         """
         rows_data: list of dicts like:
@@ -561,33 +2527,34 @@ class CooldownTracker(QWidget):
 
             row = {}
 
-            # Champion icon + caution if unknown
-            icon = get_champion_icon(champ, dd_version)
-            if icon:
-                champ_icon = QLabel()
-                champ_icon.setPixmap(icon.scaled(ICON_SIZE, ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-                caution = QLabel("")
-                container = QWidget()
-                hl = QHBoxLayout(container)
-                hl.setContentsMargins(0, 0, 0, 0)
-                hl.addWidget(champ_icon)
-                hl.addWidget(caution)
+            # Champion name (replaced by its icon once decoded) + caution if unknown
+            known = champ in champion_data.get("data", {})
+            display_name = to_display_champ(champ)
+            name_lbl = QLabel(display_name)
+            self._style_header_label(name_lbl)  # readable over crest
+            caution = QLabel("" if known else "⚠")
+            if known:
+                self._load_icon(name_lbl, [champion_icon_url(champ, dd_version)], ICON_SIZE)
             else:
-                name_lbl = QLabel(to_display_champ(champ))
-                self._style_header_label(name_lbl)  # readable over crest
-                caution = QLabel("⚠")
                 self._style_header_label(caution)
                 caution.setToolTip("Champion data missing — using fallback ultimate cooldowns")
-                container = QWidget()
-                hl = QHBoxLayout(container)
-                hl.setContentsMargins(0, 0, 0, 0)
-                hl.addWidget(name_lbl)
-                hl.addWidget(caution)
+            container = QWidget()
+            hl = QHBoxLayout(container)
+            hl.setContentsMargins(0, 0, 0, 0)
+            hl.addWidget(name_lbl)
+            hl.addWidget(caution)
             self.enemy_layout.addWidget(container, i, 0)
 
+            container.setToolTip(f"{display_name}: click when this champion dies to start its respawn timer, right-click to undo")
+            container.installEventFilter(self)
+
             row["champion"] = champ
+            row["name_label"] = name_lbl
             row["caution_label"] = caution
-            row["timers"] = {}
+            row["caution_text"] = caution.text()
+            row["champ_cell"] = container
+            row["respawn_at"] = None  # game second of the respawn, while dead
+            row["countdowns"] = {}
 
             # Level & ability haste
             lvl = QSpinBox()
@@ -607,14 +2574,10 @@ class CooldownTracker(QWidget):
             self.enemy_layout.addWidget(haste, i, 2)
             row["haste_input"] = haste
 
-            # Summoner spell 1
-            s1_btn = QPushButton()
-            s1_icon_pm = get_summoner_icon(s1_name, dd_version)
-            if s1_icon_pm:
-                s1_btn.setIcon(QIcon(s1_icon_pm.scaled(ICON_SIZE, ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)))
-                s1_btn.setIconSize(QSize(ICON_SIZE, ICON_SIZE))
-            else:
-                s1_btn.setText(s1_name)
+            # Summoner spell 1 (name until the icon arrives)
+            s1_btn = QPushButton(to_display_spell(s1_name))
+            s1_btn.setToolTip(to_display_spell(s1_name))
+            self._load_icon(s1_btn, summoner_icon_urls(s1_name, dd_version), ICON_SIZE)
             s1_lbl = QLabel("")
             self._style_cd_label(s1_lbl)
             self.enemy_layout.addWidget(s1_btn, i, 3)
@@ -625,13 +2588,9 @@ class CooldownTracker(QWidget):
             row["teleport_upgraded_s1"] = False
 
             # Summoner spell 2
-            s2_btn = QPushButton()
-            s2_icon_pm = get_summoner_icon(s2_name, dd_version)
-            if s2_icon_pm:
-                s2_btn.setIcon(QIcon(s2_icon_pm.scaled(ICON_SIZE, ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)))
-                s2_btn.setIconSize(QSize(ICON_SIZE, ICON_SIZE))
-            else:
-                s2_btn.setText(s2_name)
+            s2_btn = QPushButton(to_display_spell(s2_name))
+            s2_btn.setToolTip(to_display_spell(s2_name))
+            self._load_icon(s2_btn, summoner_icon_urls(s2_name, dd_version), ICON_SIZE)
             s2_lbl = QLabel("")
             self._style_cd_label(s2_lbl)
             self.enemy_layout.addWidget(s2_btn, i, 5)
@@ -641,115 +2600,587 @@ class CooldownTracker(QWidget):
             row["summ2_name"] = s2_name
             row["teleport_upgraded_s2"] = False
 
+            # Abilities: per-rank base cooldowns resolved once here; a press is one indexed read
+            row["ability_cds"] = get_ability_cooldowns(champ)
+            row["rank_overrides"] = {}  # slot -> rank set by right-click (else inferred from level)
+            spells = champion_data.get("data", {}).get(champ, {}).get("spells", [])
+            for j, slot in enumerate("QWE"):
+                ab_btn = QPushButton(slot)
+                if slot in row["ability_cds"]:
+                    self._load_icon(ab_btn, [ability_icon_url(spells[j], dd_version)], ICON_SIZE)
+                else:
+                    ab_btn.setEnabled(False)
+                ab_lbl = QLabel("")
+                self._style_cd_label(ab_lbl)
+                col = ABILITY_COLUMNS[2 * j]
+                self.enemy_layout.addWidget(ab_btn, i, col)
+                self.enemy_layout.addWidget(ab_lbl, i, col + 1)
+                ab_btn.setVisible(self.track_abilities)
+                ab_lbl.setVisible(self.track_abilities)
+                row[f"{slot.lower()}_btn"] = ab_btn
+                row[f"{slot.lower()}_label"] = ab_lbl
+
             # Ultimate button (icon if available; else "R")
-            ult_btn = QPushButton()
-            ult_icon = get_ultimate_icon(champ, dd_version)
-            if ult_icon:
-                ult_btn.setIcon(QIcon(ult_icon.scaled(ICON_SIZE, ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)))
-                ult_btn.setIconSize(QSize(ICON_SIZE, ICON_SIZE))
-            else:
-                ult_btn.setText("R")
+            ult_btn = QPushButton("R")
+            self._load_icon(ult_btn, ultimate_icon_urls(champ, dd_version), ICON_SIZE)
             ult_lbl = QLabel("")
             self._style_cd_label(ult_lbl)
-            self.enemy_layout.addWidget(ult_btn, i, 7)
-            self.enemy_layout.addWidget(ult_lbl, i, 8)
+            self.enemy_layout.addWidget(ult_btn, i, 13)
+            self.enemy_layout.addWidget(ult_lbl, i, 14)
             row["ult_btn"] = ult_btn
             row["ult_label"] = ult_lbl
 
-            # Lucidity + Cosmic toggle buttons
-            lucidity_pm = getattr(self, "lucidity_pm", None)
-            cosmic_pm = getattr(self, "cosmic_pm", None)
+            # Lucidity + Cosmic toggle buttons ("L"/"C" until the icons arrive)
+            l_btn = QPushButton("L")
+            l_btn.setCheckable(True)
+            l_btn.setToolTip("Ionian Boots of Lucidity (toggle)")
+            self._load_icon(l_btn, [lucidity_icon_url(dd_version)], TOGGLE_ICON_SIZE)
 
-            if lucidity_pm:
-                l_btn = QPushButton()
-                l_btn.setCheckable(True)
-                l_btn.setIcon(QIcon(lucidity_pm.scaled(TOGGLE_ICON_SIZE, TOGGLE_ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)))
-                l_btn.setIconSize(QSize(TOGGLE_ICON_SIZE, TOGGLE_ICON_SIZE))
-                l_btn.setToolTip("Ionian Boots of Lucidity (toggle)")
-            else:
-                l_btn = QPushButton("L")
-                l_btn.setCheckable(True)
-                l_btn.setToolTip("Lucidity (toggle)")
-
-            if cosmic_pm:
-                c_btn = QPushButton()
-                c_btn.setCheckable(True)
-                c_btn.setIcon(QIcon(cosmic_pm.scaled(TOGGLE_ICON_SIZE, TOGGLE_ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)))
-                c_btn.setIconSize(QSize(TOGGLE_ICON_SIZE, TOGGLE_ICON_SIZE))
-                c_btn.setToolTip("Cosmic Insight (toggle)")
-            else:
-                c_btn = QPushButton("C")
-                c_btn.setCheckable(True)
-                c_btn.setToolTip("Cosmic Insight (toggle)")
+            c_btn = QPushButton("C")
+            c_btn.setCheckable(True)
+            c_btn.setToolTip("Cosmic Insight (toggle)")
+            self._load_icon(c_btn, [COSMIC_ICON_URL], TOGGLE_ICON_SIZE)
 
             self._style_toggle_button(l_btn)
             self._style_toggle_button(c_btn)
 
-            self.enemy_layout.addWidget(l_btn, i, 9)
-            self.enemy_layout.addWidget(c_btn, i, 10)
+            self.enemy_layout.addWidget(l_btn, i, 15)
+            self.enemy_layout.addWidget(c_btn, i, 16)
             row["lucidity_btn"] = l_btn
             row["cosmic_btn"] = c_btn
 
             # Connect buttons via a method that reads current names (works after upgrades)
             s1_btn.clicked.connect(lambda _, rw=row: self._on_summoner_click(rw, slot=1))
             s2_btn.clicked.connect(lambda _, rw=row: self._on_summoner_click(rw, slot=2))
-            ult_btn.clicked.connect(lambda _, rw=row: self.start_ultimate_timer(rw))
+            for slot in "QWER":
+                btn = row["ult_btn" if slot == "R" else f"{slot.lower()}_btn"]
+                btn.clicked.connect(lambda _, rw=row, s=slot: self.start_ability_timer(rw, s))
+                btn.setContextMenuPolicy(Qt.CustomContextMenu)
+                btn.customContextMenuRequested.connect(lambda _, rw=row, s=slot: self._cycle_ability_rank(rw, s))
+                self._update_rank_tooltip(row, slot)
 
             self.enemies.append(row)
 
+    def _load_icon(self, widget, urls, size, fallback_text=None):
+        """
+        Decode the first available of `urls` off the GUI thread, then show it on `widget`
+        (QLabel pixmap or QPushButton icon). The widget keeps its placeholder text meanwhile;
+        `fallback_text` replaces it if no URL yields an image.
+        """
+        if not urls:
+            if fallback_text and not sip.isdeleted(widget):
+                widget.setText(fallback_text)
+            return
+
+        def done(pm):
+            if sip.isdeleted(widget):
+                return  # row was rebuilt before the image arrived
+            if pm is None:
+                self._load_icon(widget, urls[1:], size, fallback_text)
+            elif isinstance(widget, QLabel):
+                widget.setPixmap(pm)
+            else:
+                widget.setText("")
+                widget.setIcon(QIcon(pm))
+                widget.setIconSize(QSize(size, size))
+
+        asset_loader().request(urls[0], size, done)
+
+    # ---------- speculative icon prefetch ----------
+    def _row_icon_groups(self, champ, s1=None, s2=None):
+        """Candidate URL lists for every icon a row of `champ` (+ summoners) shows."""
+        groups = [[champion_icon_url(champ, dd_version)], ultimate_icon_urls(champ, dd_version)]
+        spells = champion_data.get("data", {}).get(champ, {}).get("spells", [])
+        groups += [[ability_icon_url(sp, dd_version)] for sp in spells[:3]]
+        groups += [summoner_icon_urls(s, dd_version) for s in (s1, s2) if s]
+        return groups
+
+    def _prefetch(self, urls, size, keys):
+        """Speculatively decode urls[0] into the store; on a miss try the next candidate."""
+        if not urls:
+            return
+        key = (urls[0], size, True)
+        keys.append(key)
+
+        def done(pm):
+            if pm is None and any(keys is current for current in self._prefetch_keys.values()):
+                self._prefetch(urls[1:], size, keys)
+
+        asset_loader().request(urls[0], size, done, speculative=True)
+
+    def _prefetch_config_row(self, index):
+        """A config row changed: cancel what its previous selection queued and warm the new one."""
+        loader = asset_loader()
+        for key in self._prefetch_keys.pop(index, []):
+            loader.cancel(key)
+        cfg = self.config_rows[index]
+        keys = self._prefetch_keys[index] = []
+        champ = cfg["champ"].currentData() or ""
+        for urls in self._row_icon_groups(champ, cfg["s1"].currentData(), cfg["s2"].currentData()):
+            self._prefetch(urls, ICON_SIZE, keys)
+
+    def _warm_popular_champions(self):
+        """Idle-time warmup of the champions seen most often in recorded games (read on the history thread)."""
+        future = _history_executor.submit(lambda: popular_champions(event_store.chunks(), PREFETCH_WARM_CHAMPIONS))
+        future.add_done_callback(lambda f: self.warm_ready.emit(f.result()))
+
+    def _queue_warmup(self, champs):
+        """Prefetch one champion's icons per idle slice: a zero-interval timer only fires when no events are pending."""
+        keys = self._prefetch_keys["warm"] = []
+        pending = list(champs)
+        timer = QTimer(self)
+
+        def step():
+            if not pending:
+                timer.stop()
+                timer.deleteLater()
+                return
+            for urls in self._row_icon_groups(pending.pop(0)):
+                self._prefetch(urls, ICON_SIZE, keys)
+
+        timer.timeout.connect(step)
+        timer.start(0)
+
     # ---------- game config apply ----------
     def apply_configuration(self):
         """Read the 5×3 dropdowns and rebuild the main page rows accordingly. Also re-applies theme."""
+        self._archive_game()  # a new lineup starts a new recorded game
         rows_data = []
         for r in self.config_rows:
-            champ_display = r["champ"].currentText()
-            champ_internal = to_internal_champ(champ_display)  # map Wukong -> MonkeyKing
-            s1 = r["s1"].currentText()
-            s2 = r["s2"].currentText()
+            champ_internal = r["champ"].currentData() or ""  # internal name (MonkeyKing, not Wukong)
+            s1 = r["s1"].currentData()
+            s2 = r["s2"].currentData()
             rows_data.append({"champ": champ_internal, "s1": s1, "s2": s2})
 
         # Clear and rebuild rows
         self._clear_enemy_rows()
         self.setup_enemy_rows(rows_data)
+        if self.game_time >= TP_UPGRADE_TIME:
+            self._upgrade_teleports()  # the scheduled upgrade already ran for the old rows
+        if locales.active:
+            self._request_locale(locales.locale)  # ability names of the new champions
         # Re-apply theme styling to ensure new widgets match theme (also satisfies "apply themes")
         self.apply_theme(self.current_theme)
         # Return to main page
         self.pages.setCurrentWidget(self.main_page)
+        self._publish_state()
+
+    def _schedule_game_events(self):
+        """Scheduled game events (TP upgrade, objective spawns, respawns) fire from the game clock."""
+        self.game_events_wheel = TimingWheel()
+        self.game_events_wheel.schedule(TP_UPGRADE_TIME, self._upgrade_teleports)
+        for name, first_spawn, _ in OBJECTIVES:
+            obj = self.objectives[name]
+            obj["spawn_at"] = first_spawn
+            obj["handle"] = self.game_events_wheel.schedule(first_spawn, self._on_objective_spawn, name)
 
     # ---------- game clock ----------
+    @property
+    def game_time(self):
+        """Elapsed game seconds, read from a monotonic reference so skipped ticks never drift."""
+        if self._clock_origin is None:
+            return self._paused_game_time
+        return int(time.monotonic() - self._clock_origin)
+
+    @game_time.setter
+    def game_time(self, seconds):
+        if self._clock_origin is None:
+            self._paused_game_time = seconds
+        else:
+            self._clock_origin = time.monotonic() - seconds
+
+    @property
+    def clock_running(self):
+        return self._clock_origin is not None
+
     def start_timer(self):
         """Start the game timer (if not already running)."""
-        if not self.game_timer.isActive():
-            self.game_timer.start(1000)
+        if not self.clock_running:
+            self._clock_origin = time.monotonic() - self._paused_game_time
+            self._reschedule_tick()
+            self._publish_state()
 
+    def new_game(self):
+        """
+        Archive this game's presses and start over at 0:00 with the same lineup: clock stopped,
+        no countdowns, objectives and respawns back to their first spawn, session file deleted.
+        """
+        self._archive_game()
+        self._clock_origin = None
+        self._paused_game_time = 0
+        rows_data = [{"champ": row["champion"],
+                      "s1": row["summ1_name"].replace("U. ", ""),  # undo the 10:00 upgrade
+                      "s2": row["summ2_name"].replace("U. ", "")} for row in self.enemies]
+        self._clear_enemy_rows()  # countdowns and respawns go with the rows
+        self.setup_enemy_rows(rows_data)
+        if locales.active:
+            self._request_locale(locales.locale)
+        self.apply_theme(self.current_theme)
+        self._schedule_game_events()
+        self.timer_label.setText("Game Time: 0:00")
+        self.cd_log_label.setText("Cooldown Log: None")
+        self.cd_log_token = None
+        self._update_game_event_labels()
+        self._last_snapshot = self._session_state()  # nothing to resume until the next change
+        remove_session_snapshot(self.session_file)
+        self._reschedule_tick()
+        self._publish_state()
+
+    @traced()
     def update_game_time(self):
-        self.game_time += 1
-        m = self.game_time // 60
-        s = self.game_time % 60
+        m, s = divmod(self.game_time, 60)
         self.timer_label.setText(f"Game Time: {m}:{s:02d}")
 
-        # At 10:00, upgrade Teleport -> Unleashed Teleport (icon swap only; running CDs keep counting)
-        if self.game_time == 600:
-            ut_icon = get_summoner_icon("U. Teleport", dd_version)
+        # Due game events (TP upgrade at 10:00, objective spawns, respawns); a tick skipped while
+        # minimized fires them on catch-up
+        self.game_events_wheel.advance(self.game_time)
+        self._update_game_event_labels()
+        self._publish_state()
+
+    # ---------- adaptive tick ----------
+    def _display_mode(self):
+        """"hidden" (minimized/hidden), "coalesced" (low-power and likely behind the game) or "live"."""
+        if not self.isVisible() or self.window().isMinimized():
+            return "hidden"
+        if self.low_power and not self.isActiveWindow() and not self.keep_on_top:
+            return "coalesced"
+        return "live"
+
+    def _reschedule_tick(self):
+        """
+        Arm the next wakeup, or none at all: no tick while neither the clock nor any countdown
+        runs, and none while hidden (unless connected push subscribers need the clock). Values are always
+        recomputed from monotonic deadlines, so a skipped tick only delays the display.
+        """
+        if not hasattr(self, "snapshot_timer"):
+            return  # still constructing
+        active = self.clock_running or any(row["countdowns"] for row in self.enemies)
+        mode = self._display_mode()
+        if not active or (mode == "hidden" and not (self.push_server and self.push_server.has_subscribers)):
+            self.scheduler.disarm(self)
+            self.snapshot_timer.stop()
+            self._snapshot_session()  # idle: persist the final state once
+            return
+        if not self.snapshot_timer.isActive():
+            self.snapshot_timer.start(SNAPSHOT_INTERVAL_MS)
+        if mode == "coalesced":
+            interval = COALESCED_TICK_MS
+        else:
+            # Land just after the next change of any displayed value: the next whole game second,
+            # or the next whole second left on a countdown, so nothing skips or repeats
+            now = time.monotonic()
+            waits = [(cd["deadline"] - now) % 1.0 or 1.0 for row in self.enemies for cd in row["countdowns"].values()]
+            if self.clock_running:
+                waits.append(1.0 - (now - self._clock_origin) % 1.0)
+            interval = int(min(waits) * 1000) + 5
+        self.scheduler.arm(self, interval)
+        self._tick_due = time.monotonic() + interval / 1000
+
+    def _on_tick_timer(self):
+        if self._tick_due is not None:
+            self.tick_lateness.add(max(0.0, (time.monotonic() - self._tick_due) * 1000))
+        self._on_tick()
+
+    def _on_tick(self):
+        tracer.count("wakeups")
+        if self.clock_running:
+            self.update_game_time()
+        self._tick_countdowns()
+        self._reschedule_tick()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if hasattr(self, "snapshot_timer"):
+            self._on_tick()  # catch the display up after being hidden
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if hasattr(self, "snapshot_timer"):
+            self._reschedule_tick()
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() in (QEvent.WindowStateChange, QEvent.ActivationChange) and hasattr(self, "snapshot_timer"):
+            self._on_tick()
+
+    # ---------- scheduled game events ----------
+    def _on_objective_spawn(self, name):
+        obj = self.objectives[name]
+        obj["spawn_at"], obj["handle"] = None, None  # up
+        self._set_cd_log(f"{name} spawned", ("objective", name))
+        self._update_game_event_labels()
+
+    def _on_objective_taken(self, name):
+        """Schedule the respawn (if any) from now; one-off objectives are marked done."""
+        obj = self.objectives[name]
+        self.game_events_wheel.cancel(obj["handle"])
+        respawn = next(r for n, _, r in OBJECTIVES if n == name)
+        if respawn:
+            obj["spawn_at"] = self.game_time + respawn
+            obj["handle"] = self.game_events_wheel.schedule(obj["spawn_at"], self._on_objective_spawn, name)
+        else:
+            obj["spawn_at"], obj["handle"] = -1, None  # taken for good
+        self._update_game_event_labels()
+        self._publish_state()
+
+    def _on_champion_died(self, row):
+        """Click on a champion: respawn countdown from its level and the game time."""
+        self.game_events_wheel.cancel(row.get("respawn_handle"))
+        row["respawn_at"] = self.game_time + respawn_seconds(row["level_spinner"].value(), self.game_time)
+        row["respawn_handle"] = self.game_events_wheel.schedule(row["respawn_at"], self._on_respawn, row)
+        self._update_game_event_labels()
+        self._publish_state()
+
+    def _on_death_undone(self, row):
+        """Right-click on a champion: cancel a death recorded by mistake."""
+        if row.get("respawn_at") is None:
+            return
+        self.game_events_wheel.cancel(row.get("respawn_handle"))
+        row["respawn_at"], row["respawn_handle"] = None, None
+        row["caution_label"].setText(row["caution_text"])
+        self._publish_state()
+
+    def _on_respawn(self, row):
+        row["respawn_at"], row["respawn_handle"] = None, None
+        row["caution_label"].setText(row["caution_text"])
+        self._set_cd_log(f"{to_display_champ(row['champion'])} respawned", ("respawn", id(row)))
+
+    def _update_game_event_labels(self):
+        now = self.game_time
+        for name, obj in self.objectives.items():
+            at = obj["spawn_at"]
+            if at is None:
+                text = f"{name} up"
+            elif at < 0:
+                text = f"{name} –"
+            else:
+                m, s = divmod(max(at - now, 0), 60)
+                text = f"{name} {m}:{s:02d}"
+            if obj["btn"].text() != text:
+                obj["btn"].setText(text)
+        for row in self.enemies:
+            if row.get("respawn_at") is not None:
+                row["caution_label"].setText(f"💀{max(row['respawn_at'] - now, 0)}s")
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.MouseButtonPress:
             for row in self.enemies:
-                # slot 1
-                if not row.get("teleport_upgraded_s1") and row.get("summ1_name") == "Teleport":
-                    row["teleport_upgraded_s1"] = True
-                    row["summ1_name"] = "U. Teleport"
-                    if ut_icon:
-                        row["spell1_btn"].setIcon(QIcon(ut_icon.scaled(ICON_SIZE, ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)))
-                        row["spell1_btn"].setIconSize(QSize(ICON_SIZE, ICON_SIZE))
+                if row["champ_cell"] is obj:
+                    if event.button() == Qt.RightButton:
+                        self._on_death_undone(row)
                     else:
-                        row["spell1_btn"].setText("U. Teleport")
-                # slot 2
-                if not row.get("teleport_upgraded_s2") and row.get("summ2_name") == "Teleport":
-                    row["teleport_upgraded_s2"] = True
-                    row["summ2_name"] = "U. Teleport"
-                    if ut_icon:
-                        row["spell2_btn"].setIcon(QIcon(ut_icon.scaled(ICON_SIZE, ICON_SIZE, Qt.KeepAspectRatio, Qt.SmoothTransformation)))
-                        row["spell2_btn"].setIconSize(QSize(ICON_SIZE, ICON_SIZE))
-                    else:
-                        row["spell2_btn"].setText("U. Teleport")
+                        self._on_champion_died(row)
+                    return True
+        return super().eventFilter(obj, event)
+
+    def _upgrade_teleports(self):
+        ut_urls = summoner_icon_urls("U. Teleport", dd_version)
+        for row in self.enemies:
+            # slot 1
+            if not row.get("teleport_upgraded_s1") and row.get("summ1_name") == "Teleport":
+                row["teleport_upgraded_s1"] = True
+                row["summ1_name"] = "U. Teleport"
+                self._load_icon(row["spell1_btn"], ut_urls, ICON_SIZE, fallback_text="U. Teleport")
+            # slot 2
+            if not row.get("teleport_upgraded_s2") and row.get("summ2_name") == "Teleport":
+                row["teleport_upgraded_s2"] = True
+                row["summ2_name"] = "U. Teleport"
+                self._load_icon(row["spell2_btn"], ut_urls, ICON_SIZE, fallback_text="U. Teleport")
+
+    # ---------- teammate sync ----------
+    def _setup_sync(self):
+        host, _, port = SYNC_GROUP.partition(":")
+        self.sync_addr = QHostAddress(host)
+        self.sync_port = int(port or 47777)
+        self.sync_socket = QUdpSocket(self)
+        # ShareAddress lets several trackers on one machine join the same group (localhost testing)
+        bound = self.sync_socket.bind(
+            QHostAddress(QHostAddress.AnyIPv4), self.sync_port,
+            QUdpSocket.ShareAddress | QUdpSocket.ReuseAddressHint,
+        )
+        if not bound or not self.sync_socket.joinMulticastGroup(self.sync_addr):
+            print("Error joining sync group:", self.sync_socket.errorString())
+            return
+        self.sync_socket.setSocketOption(QAbstractSocket.MulticastLoopbackOption, 1)
+        self.sync_socket.setSocketOption(QAbstractSocket.MulticastTtlOption, 1)  # stay on the LAN
+        self.sync_socket.readyRead.connect(self._on_sync_datagrams)
+        self.sync = CooldownSync(SYNC_ROOM)
+
+    def _broadcast_press(self, row, key, remaining):
+        if not self.sync:
+            return
+        champ = row["champion"]
+        pressed_at = self.sync.stamp_local(champ, key, self.game_time)
+        packet = self.sync.encode(champ, key, pressed_at, self.game_time + remaining)
+        self.sync_socket.writeDatagram(packet, self.sync_addr, self.sync_port)
+
+    def _on_sync_datagrams(self):
+        while self.sync_socket.hasPendingDatagrams():
+            data, _, _ = self.sync_socket.readDatagram(self.sync_socket.pendingDatagramSize())
+            msg = self.sync.decode(data)
+            if not msg:
+                continue
+            champ, key, pressed_at, ready_at, sender = msg
+            if self.sync.accept(champ, key, pressed_at, sender):
+                self._apply_remote_press(champ, key, ready_at)
+
+    def _apply_remote_press(self, champ, key, ready_at):
+        remaining = ready_at - self.game_time
+        if remaining <= 0:
+            return
+        for row in self.enemies:
+            if row["champion"] != champ:
+                continue
+            label_key = self._label_key_for(row, key)
+            if label_key:
+                # Use this row's own key for the slot (a remote "Teleport" press lands on a local
+                # "U. Teleport" countdown after 10:00) so the slot never runs two countdowns
+                if label_key in ("spell1_label", "spell2_label"):
+                    key = f"summoner:{row['summ' + label_key[5] + '_name']}"
+                spell = "R" if key == "ult" else key.split(":", 1)[1]  # ability:Q -> Q
+                rm, rs = divmod(ready_at, 60)
+                log_text = f"{to_display_champ(champ)} {to_display_spell(spell)} – {rm}:{rs:02d} (synced)"
+                self._start_countdown(row, key, label_key, remaining, log_text)
+                self._record_press(row, key, synced=True)
+
+    @staticmethod
+    def _label_key_for(row, key):
+        """Which CD label a countdown key belongs to on this row (None if the row lacks that spell)."""
+        if key == "ult":
+            return "ult_label"
+        if key.startswith("ability:"):
+            slot = key.split(":", 1)[1]
+            return f"{slot.lower()}_label" if slot in row["ability_cds"] else None
+        # Teleport / U. Teleport are the same slot whichever side of 10:00 each tracker is on
+        spell = key.split(":", 1)[1].replace("U. ", "")
+        if row["summ1_name"].replace("U. ", "") == spell:
+            return "spell1_label"
+        if row["summ2_name"].replace("U. ", "") == spell:
+            return "spell2_label"
+        return None
+
+    # ---------- game analytics ----------
+    def _record_press(self, row, key, synced=False):
+        self.game_events.append([self.game_time, row["champion"], key, synced])
+
+    def _lineup(self):
+        return [row["champion"] for row in self.enemies]
+
+    def _archive_game(self):
+        event_store.add_game(self._lineup(), self.game_events, self.game_started_at)
+        self.game_events = []
+        self.game_started_at = time.time()
+
+    def _show_analysis_page(self):
+        page = self._page("analysis")
+        current = EventChunk()
+        current.add_game(self._lineup(), self.game_events, self.game_started_at)
+        self.analysis_labels["This game"].setText(analysis_report([current]))
+        # Every recorded chunk is read and aggregated on the history thread
+        self.analysis_labels["All recorded games"].setText("Analyzing…")
+        future = _history_executor.submit(lambda: analysis_report(event_store.chunks() + [current]))
+        future.add_done_callback(lambda f: self.analysis_ready.emit("All recorded games", f.result()))
+        self.pages.setCurrentWidget(page)
+
+    # ---------- push server ----------
+    def _publish_state(self):
+        """Send the flat clock/rows/cooldowns view to push subscribers (no-op when disabled)."""
+        if not self.push_server:
+            return
+        state = {"game_time": self.game_time, "running": self.clock_running}
+        for name, obj in self.objectives.items():
+            state[f"objectives.{name}"] = obj["spawn_at"]  # game second; None = up, -1 = taken for good
+        for i, row in enumerate(self.enemies):
+            prefix = f"rows.{i}."
+            state[prefix + "champ"] = row["champion"]
+            state[prefix + "s1"] = row["summ1_name"]
+            state[prefix + "s2"] = row["summ2_name"]
+            state[prefix + "level"] = row["level_spinner"].value()
+            state[prefix + "respawn_at"] = row["respawn_at"]
+            # Absolute ready times (epoch seconds) so subscribers count down locally
+            for key, cd in row["countdowns"].items():
+                state[f"{prefix}cd.{key}"] = cd["ends_at"]
+        self.push_server.publish(state)
+
+    # ---------- session snapshot ----------
+    def _session_state(self):
+        """Everything needed to rebuild the tracker mid-game, as plain JSON-safe values."""
+        rows = []
+        for row in self.enemies:
+            rows.append({
+                "champ": row["champion"],
+                "s1": row["summ1_name"],
+                "s2": row["summ2_name"],
+                "level": row["level_spinner"].value(),
+                "haste": row["haste_input"].text(),
+                "lucidity": row["lucidity_btn"].isChecked(),
+                "cosmic": row["cosmic_btn"].isChecked(),
+                "ranks": row["rank_overrides"],
+                "respawn_at": row["respawn_at"],
+                "countdowns": {k: [c["label"], self._countdown_left(c)] for k, c in row["countdowns"].items()},
+            })
+        return {
+            "game_time": self.game_time,
+            "running": self.clock_running,
+            "low_power": self.low_power,
+            "theme": self.current_theme,
+            "crest_opacity": self.crest_opacity,
+            "window_opacity": self.window_opacity,
+            "keep_on_top": self.keep_on_top,
+            "track_abilities": self.track_abilities,
+            "locale": self.locale,
+            "objectives": {name: obj["spawn_at"] for name, obj in self.objectives.items()},
+            "game_events": list(self.game_events),  # copy: the live list keeps growing
+            "game_started_at": self.game_started_at,
+            "rows": rows,
+        }
+
+    def _snapshot_session(self, clean=False):
+        """Queue a write of the state; `clean` on close marks the game finished (see load_session_snapshot)."""
+        state = self._session_state()
+        if state == self._last_snapshot and not clean:
+            return  # nothing changed since the last write
+        self._last_snapshot = state
+        save_session_snapshot(dict(state, saved_at=time.time(), clean=clean), self.session_file)
+
+    def _apply_session_snapshot(self, snap):
+        """Resume clock, row inputs, settings and running countdowns from a saved session."""
+        wall_elapsed = max(0, int(time.time() - snap["saved_at"]))
+        running = snap.get("running", False)
+        self.game_time = snap.get("game_time", 0) + (wall_elapsed if running else 0)
+        m, s = divmod(self.game_time, 60)
+        self.timer_label.setText(f"Game Time: {m}:{s:02d}")
+
+        for row, saved in zip(self.enemies, snap.get("rows", [])):
+            row["level_spinner"].setValue(saved.get("level", 6))
+            row["haste_input"].setText(saved.get("haste", ""))
+            row["lucidity_btn"].setChecked(saved.get("lucidity", False))
+            row["cosmic_btn"].setChecked(saved.get("cosmic", False))
+            row["rank_overrides"] = dict(saved.get("ranks", {}))
+            if saved.get("respawn_at") is not None:
+                row["respawn_at"] = saved["respawn_at"]
+                row["respawn_handle"] = self.game_events_wheel.schedule(row["respawn_at"], self._on_respawn, row)
+            for slot in "QWER":
+                self._update_rank_tooltip(row, slot)
+            # Countdowns run on wall time whether or not the game clock was started
+            for key, (label_key, remaining) in saved.get("countdowns", {}).items():
+                if remaining - wall_elapsed > 0:
+                    self._start_countdown(row, key, label_key, remaining - wall_elapsed)
+                else:
+                    row[label_key].setText("R")
+
+        for name, spawn_at in snap.get("objectives", {}).items():
+            obj = self.objectives.get(name)
+            if obj is None:
+                continue
+            self.game_events_wheel.cancel(obj["handle"])
+            obj["spawn_at"], obj["handle"] = spawn_at, None
+            if spawn_at is not None and spawn_at >= 0:
+                obj["handle"] = self.game_events_wheel.schedule(spawn_at, self._on_objective_spawn, name)
+        self.game_events_wheel.advance(self.game_time)  # TP upgrade / spawns that fell due meanwhile
+        self._update_game_event_labels()
+        if running:
+            self.start_timer()
 
     # ---------- helpers ----------
     def _on_opacity_changed(self, value: int):
@@ -761,19 +3192,104 @@ class CooldownTracker(QWidget):
 
     def _on_window_opacity_changed(self, value: int):
         """Settings page window opacity: 10..100 -> 0.10..1.00"""
+        self.window_opacity = value
         op = value / 100.0
-        self.setWindowOpacity(op)
+        self.window().setWindowOpacity(op)
         self.window_opacity_value.setText(f"{op:.2f}")
 
+    def _on_abilities_toggled(self, state: int):
+        """Show/hide the Q/W/E columns (running ability countdowns keep counting either way)."""
+        self.track_abilities = bool(state)
+        for r in range(len(self.enemies) + 1):
+            for col in ABILITY_COLUMNS:
+                item = self.enemy_layout.itemAtPosition(r, col)
+                if item and item.widget():
+                    item.widget().setVisible(self.track_abilities)
+        self._snapshot_session()
+
+    def _show_settings_page(self):
+        page = self._page("settings")
+        self.image_memory_label.setText(f"Image memory: {pixmap_store.report()}")
+        timing = f"Tick lateness: {self.tick_lateness.summary()}"
+        if self.watchdog:
+            timing += "\n" + self.watchdog.report()
+        self.timing_label.setText(timing)
+        self.pages.setCurrentWidget(page)
+
+    def _on_locale_selected(self, locale: str):
+        self.locale = locale
+        if locale == DEFAULT_LOCALE:
+            self._on_locale_ready(locale, True)
+        else:
+            self._request_locale(locale)
+
+    def _request_locale(self, locale):
+        """Load `locale` (with ability names for the current rows) on the locale thread, then swap it in."""
+        champs = [row["champion"] for row in self.enemies]
+        future = _locale_loader.submit(locales.load, locale, champs)
+        future.add_done_callback(lambda f: self.locale_ready.emit(locale, f.result() is not None))
+
+    def _on_locale_ready(self, locale, loaded):
+        if locale != self.locale:
+            return  # superseded by a later selection
+        if not loaded:
+            print(f"Locale pack {locale} unavailable (offline and not cached); keeping {locales.locale}")
+            locale = self.locale = locales.locale
+        locales.activate(locale)
+        trackers = [self] if self.lobby is None else self.window().findChildren(CooldownTracker)
+        for tracker in trackers:  # the active locale is process-wide
+            tracker.locale = locale
+            tracker._relabel()
+        self._snapshot_session()
+
+    def _relabel(self):
+        """Show names in the active locale in place: rows are not rebuilt and no image is refetched."""
+        for row in self.enemies:
+            name = to_display_champ(row["champion"])
+            pm = row["name_label"].pixmap()
+            if pm is None or pm.isNull():  # icon not shown (yet): the name is the placeholder
+                row["name_label"].setText(name)
+            row["champ_cell"].setToolTip(f"{name}: click when this champion dies to start its respawn timer, right-click to undo")
+            for slot in (1, 2):
+                btn, spell = row[f"spell{slot}_btn"], to_display_spell(row[f"summ{slot}_name"])
+                btn.setToolTip(spell)
+                if btn.icon().isNull():
+                    btn.setText(spell)
+            for slot in "QWER":
+                self._update_rank_tooltip(row, slot)
+        if "config" in self._built_pages:
+            for cfg in self.config_rows:
+                self._fill_config_row(cfg)
+        if "settings" in self._built_pages:
+            self.locale_cb.blockSignals(True)
+            self.locale_cb.setCurrentText(self.locale)
+            self.locale_cb.blockSignals(False)
+
+    def _on_low_power_toggled(self, state: int):
+        self.low_power = state == Qt.Checked
+        self._on_tick()
+
     def _on_keep_on_top_toggled(self, state: int):
-        enabled = state == Qt.Checked
-        flags = self.windowFlags()
+        enabled = self.keep_on_top = state == Qt.Checked
+        window = self.window()  # the LobbyWindow in multi-lobby mode
+        flags = window.windowFlags()
         if enabled:
-            self.setWindowFlags(flags | Qt.WindowStaysOnTopHint)
+            window.setWindowFlags(flags | Qt.WindowStaysOnTopHint)
         else:
-            self.setWindowFlags(flags & ~Qt.WindowStaysOnTopHint)
+            window.setWindowFlags(flags & ~Qt.WindowStaysOnTopHint)
         # Re-show to apply new flags
-        self.show()
+        window.show()
+
+    def _update_trace_overlay(self):
+        spans = " | ".join(f"{k} {v:.1f}ms" for k, v in sorted(dict(tracer.last_ms).items()))
+        c = dict(tracer.counters)
+        self.trace_label.setText(
+            f"{spans}\n"
+            f"fetched {c.get('bytes_fetched', 0) / 1024:.0f} KB | "
+            f"cache {c.get('cache_hits', 0)} hit / {c.get('cache_misses', 0)} miss | "
+            f"scales {c.get('pixmap_scales', 0)} | "
+            f"images {pixmap_store.report()}"
+        )
 
     def _set_cd_log(self, text, token):
         self.cd_log_token = token
@@ -869,131 +3385,127 @@ class CooldownTracker(QWidget):
     # ---------- summoner spells ----------
     def _on_summoner_click(self, row, slot: int):
         """Reads current summoner name for the slot and starts that timer."""
-        label = row["spell1_label"] if slot == 1 else row["spell2_label"]
+        label_key = "spell1_label" if slot == 1 else "spell2_label"
         name_key = "summ1_name" if slot == 1 else "summ2_name"
         spell_name = row.get(name_key, "Flash")
-        self.start_summoner_timer(row, spell_name, label)
-
-    def start_summoner_timer(self, row, spell_name, label):
-        # Base CDs (seconds)
-        base_cds = {
-            "Flash": 300, "Teleport": 300,
-            "Clarity": 240, "Cleanse": 240, "Exhaust": 240,
-            "Ghost": 240, "Heal": 240, "Barrier": 180,
-            "Ignite": 180, "Smite": 90, "U. Teleport": 0  # placeholder; handled below
-        }
-
-        # Unleashed Teleport scales 330 (lvl1) → 240 (lvl10+), step -10 per level
-        if spell_name == "U. Teleport":
-            level = row["level_spinner"].value()
-            base_cd = max(330 - (level - 1) * 10, 240)
-        else:
-            base_cd = base_cds.get(spell_name, 300)
-
-        # Apply per-row Lucidity / Cosmic
-        lucidity = row["lucidity_btn"].isChecked()
-        cosmic = row["cosmic_btn"].isChecked()
-        if lucidity and cosmic:
-            cd = base_cd * 0.78125
-        elif lucidity:
-            cd = base_cd * 0.9091
-        elif cosmic:
-            cd = base_cd * 0.8475
-        else:
-            cd = base_cd
-
-        # Stop existing timer for this specific spell, if any
-        key = f"summoner:{spell_name}"
-        if key in row["timers"]:
-            row["timers"][key].stop()
-
-        # Show initial CD
-        remaining = int(cd)
-        label.setText(f"{remaining}s")
+        self.start_summoner_timer(row, spell_name, label_key)
+
+    def start_summoner_timer(self, row, spell_name, label_key):
+        # Final CD (seconds) for this level + per-row Lucidity / Cosmic, from the patch table
+        idx = summoner_cd_index(
+            row["level_spinner"].value(),
+            row["lucidity_btn"].isChecked(),
+            row["cosmic_btn"].isChecked(),
+        )
+        cds = summoner_cd_table.get(spell_name)
+        remaining = int(cds[idx] if cds else 300)
 
         # Log ready time (single line)
         ready_time = self.game_time + remaining
         rm, rs = divmod(ready_time, 60)
-        log_text = f"{to_display_champ(row['champion'])} {spell_name} – {rm}:{rs:02d}"
-
-        # Make a token tied to this timer instance
-        timer = QTimer(self)
-        token = (id(timer), key)
-        self._set_cd_log(log_text, token)
-
-        timer.setInterval(1000)
-
-        def tick():
-            nonlocal remaining
-            remaining -= 1
-            if remaining > 0:
-                label.setText(f"{remaining}s")
-            else:
-                label.setText("R")  # compact 'ready' indicator
-                timer.stop()
-                self._clear_cd_log_if_owned(token)
-
-        timer.timeout.connect(tick)
-        timer.start()
-        row["timers"][key] = timer
+        log_text = f"{to_display_champ(row['champion'])} {to_display_spell(spell_name)} – {rm}:{rs:02d}"
+        self._start_countdown(row, f"summoner:{spell_name}", label_key, remaining, log_text)
+        self._record_press(row, f"summoner:{spell_name}")
+        self._broadcast_press(row, f"summoner:{spell_name}", remaining)
+
+    # ---------- abilities (Q/W/E/R) ----------
+    def _ability_rank(self, row, slot):
+        """Rank set by right-click, else inferred from the level; always within 1..max rank."""
+        rank = row["rank_overrides"].get(slot) or ABILITY_RANKS[row["level_spinner"].value() - 1]["QWER".index(slot)]
+        return min(max(rank, 1), len(row["ability_cds"][slot]))
+
+    def _cycle_ability_rank(self, row, slot):
+        """Right-click: auto -> 1 -> 2 -> ... -> max rank -> auto."""
+        cds = row["ability_cds"].get(slot)
+        if not cds:
+            return
+        current = row["rank_overrides"].get(slot)
+        if current == len(cds):
+            row["rank_overrides"].pop(slot, None)
+        else:
+            row["rank_overrides"][slot] = (current or 0) + 1
+        self._update_rank_tooltip(row, slot)
 
-    # ---------- ultimates ----------
-    def start_ultimate_timer(self, row):
-        champ = row["champion"]
-        level = row["level_spinner"].value()
+    def _update_rank_tooltip(self, row, slot):
+        btn = row["ult_btn" if slot == "R" else f"{slot.lower()}_btn"]
+        if slot not in row["ability_cds"]:
+            btn.setToolTip(f"{slot}: no cooldown data for this champion")
+            return
+        rank = row["rank_overrides"].get(slot)
+        name = ability_name(row["champion"], slot)
+        label = f"{name} ({slot})" if name else slot
+        btn.setToolTip(f"{label} rank: {rank or 'auto (from level)'} — right-click to change")
+
+    def start_ability_timer(self, row, slot):
+        cds = row["ability_cds"].get(slot)
+        if not cds:
+            return
         try:
             haste = int(row["haste_input"].text())
         except ValueError:
             haste = 0
-
-        ult_cds = get_ultimate_cooldowns(champ)
-        # Determine ult rank by level (6/11/16)
-        if level >= 16:
-            rank = 3
-        elif level >= 11:
-            rank = 2
-        else:
-            rank = 1
-
-        base_cd = ult_cds[rank - 1]
-        cdr = ability_haste_to_cdr_percent(haste)
-        final_cd = base_cd * (1 - cdr)
-
-        # Stop existing ult timer for this row
-        key = "ult"
-        if key in row["timers"]:
-            row["timers"][key].stop()
-
-        remaining = int(final_cd)
-        label = row["ult_label"]
-        label.setText(f"{remaining}s")
+        base_cd = cds[self._ability_rank(row, slot) - 1]
+        remaining = int(base_cd * (1 - ability_haste_to_cdr_percent(haste)))
+        if remaining <= 0:
+            return  # toggles / no-cooldown abilities
 
         # Log ready time (single line)
         ready_time = self.game_time + remaining
         rm, rs = divmod(ready_time, 60)
-        log_text = f"{to_display_champ(champ)} R – {rm}:{rs:02d}"
-
-        timer = QTimer(self)
-        token = (id(timer), key)
-        self._set_cd_log(log_text, token)
-
-        timer.setInterval(1000)
-
-        def tick():
-            nonlocal remaining
-            remaining -= 1
-            if remaining > 0:
-                label.setText(f"{remaining}s")
-            else:
-                label.setText("R")  # compact 'ready' indicator
-                timer.stop()
-                self._clear_cd_log_if_owned(token)
-
-        timer.timeout.connect(tick)
-        timer.start()
-        row["timers"][key] = timer
+        log_text = f"{to_display_champ(row['champion'])} {slot} – {rm}:{rs:02d}"
+        key = "ult" if slot == "R" else f"ability:{slot}"
+        label_key = "ult_label" if slot == "R" else f"{slot.lower()}_label"
+        self._start_countdown(row, key, label_key, remaining, log_text)
+        self._record_press(row, key)
+        self._broadcast_press(row, key, remaining)
+
+    # ---------- countdowns ----------
+    def _start_countdown(self, row, key, label_key, remaining, log_text=None):
+        """
+        (Re)start countdown `key` on row[label_key]. It is a monotonic deadline in
+        row["countdowns"], advanced by the shared tick (see _reschedule_tick).
+        """
+        row[label_key].setText(f"{remaining}s")
+        # Token tied to this countdown instance (owns the log line)
+        token = (next(self._countdown_ids), key)
+        for other in [k for k, cd in row["countdowns"].items() if cd["label"] == label_key and k != key]:
+            del row["countdowns"][other]  # one countdown per slot (e.g. Teleport -> U. Teleport)
+        row["countdowns"][key] = {  # replaces any running countdown for this key
+            "label": label_key,
+            "token": token,
+            "deadline": time.monotonic() + remaining,
+            "ends_at": round(time.time() + remaining, 1),  # wall clock, for push subscribers
+        }
+        if log_text:
+            self._set_cd_log(log_text, token)
+        self._reschedule_tick()
+        self._publish_state()
+
+    @staticmethod
+    def _countdown_left(cd):
+        """Whole seconds left, rounded up: shows "1s" until the deadline itself, then ready."""
+        return max(0, math.ceil(cd["deadline"] - time.monotonic()))
+
+    @traced()
+    def _tick_countdowns(self):
+        finished = False
+        for row in self.enemies:
+            for key, cd in list(row["countdowns"].items()):
+                left = self._countdown_left(cd)
+                if left > 0:
+                    if cd.get("shown") != left:  # coalesced ticks skip labels that did not change
+                        cd["shown"] = left
+                        row[cd["label"]].setText(f"{left}s")
+                else:
+                    row[cd["label"]].setText("R")  # compact 'ready' indicator
+                    del row["countdowns"][key]
+                    self._clear_cd_log_if_owned(cd["token"])
+                    finished = True
+        if finished:
+            self._publish_state()
 
     # ---------- theming ----------
+    @traced()
     def apply_theme(self, theme_name: str):
         spec = THEMES.get(theme_name, THEMES["Default"])
         self.current_theme = theme_name
@@ -1049,12 +3561,15 @@ class CooldownTracker(QWidget):
         # Keep timer/log transparent with shadow; add accent underline only to timer
         self._style_glassy_label(self.timer_label, underline=True)
         self._style_glassy_label(self.cd_log_label, underline=False)
+        if self.trace_label:
+            self._style_glassy_label(self.trace_label, underline=False)
 
         # Style toolbar buttons (start, config, themes, settings)
         style_tool_button(self.start_btn, accent, fg)
         style_tool_button(self.config_btn, accent, fg)
         style_tool_button(self.themes_btn, accent, fg)
         style_tool_button(self.settings_btn, accent, fg)
+        style_tool_button(self.analysis_btn, accent, fg)
 
         # Restyle toggle buttons & cooldown labels & headers for current theme
         for row in getattr(self, "enemies", []):
@@ -1066,8 +3581,9 @@ class CooldownTracker(QWidget):
                 self._style_cd_label(row["spell1_label"])
             if "spell2_label" in row:
                 self._style_cd_label(row["spell2_label"])
-            if "ult_label" in row:
-                self._style_cd_label(row["ult_label"])
+            for label_key in ("q_label", "w_label", "e_label", "ult_label"):
+                if label_key in row:
+                    self._style_cd_label(row[label_key])
 
         # Restyle header cells on main grid
         for col in range(self.enemy_layout.columnCount()):
@@ -1077,32 +3593,70 @@ class CooldownTracker(QWidget):
                 if isinstance(w, QLabel):
                     self._style_header_label(w)
 
-        # Crest handling
-        crest_pm = None
-        if spec.get("crest_url"):
-            crest_pm = _fetch_pixmap(spec["crest_url"])
-        self.current_crest = crest_pm
+        # Crest handling (decoded lazily at window size in _update_crest_background)
+        if spec.get("crest_url") != self.current_crest_url:
+            self.current_crest_url = spec.get("crest_url")
+            self.current_crest = None
+            self._crest_is_native = False
+            self._crest_pending = None
+            pixmap_store.pin("crest", None)
         self._update_crest_background()
 
+    def _crest_variant(self, side):
+        """
+        Crest pixmap held for the current theme. When it is smaller than `side` (and not already
+        the native image), a window-sized variant is decoded off-thread from the disk cache and
+        the background is refreshed once it arrives.
+        """
+        base = self.current_crest
+        if base is not None and (self._crest_is_native or side <= max(base.width(), base.height())):
+            return base
+        url = self.current_crest_url
+        if self._crest_pending != url:
+            self._crest_pending = url
+
+            def done(pm):
+                if self._crest_pending == url:
+                    self._crest_pending = None
+                if pm is None or url != self.current_crest_url:
+                    return
+                self.current_crest = pm
+                self._crest_is_native = max(pm.width(), pm.height()) < side  # workers never upscale
+                self._crest_native_side = min(pm.width(), pm.height())
+                pixmap_store.pin("crest", pm)
+                self._update_crest_background()
+
+            asset_loader().request(url, side, done, icon=False)
+        return base
+
+    @traced()
     def _update_crest_background(self):
         if not hasattr(self, "bg_label"):
             return
         page = self.main_page
         self._position_background_label(page)
 
-        if self.current_crest:
-            native_w = self.current_crest.width()
-            native_h = self.current_crest.height()
+        target_side = int(min(page.width(), page.height()) * BG_SCALE)
+        crest = self._crest_variant(target_side) if self.current_crest_url else None
+        if crest:
+            native_w = crest.width()
+            native_h = crest.height()
             if native_w <= 0 or native_h <= 0:
                 self.bg_label.hide()
                 return
 
-            target_side = int(min(page.width(), page.height()) * BG_SCALE)
-            target_side = min(target_side, min(native_w, native_h))
+            if self._crest_is_native:
+                target_side = min(target_side, self._crest_native_side)
+            else:
+                target_side = min(target_side, max(native_w, native_h))
 
-            pm = self.current_crest.scaled(
-                target_side, target_side, Qt.KeepAspectRatio, Qt.SmoothTransformation
-            )
+            if max(native_w, native_h) == target_side:
+                pm = crest
+            else:
+                tracer.count("pixmap_scales")
+                pm = crest.scaled(
+                    target_side, target_side, Qt.KeepAspectRatio, Qt.SmoothTransformation
+                )
             self.bg_label.setPixmap(pm)
             x = (page.width() - pm.width()) // 2
             y = (page.height() - pm.height()) // 2
@@ -1119,11 +3673,105 @@ class CooldownTracker(QWidget):
         super().resizeEvent(event)
         self._update_crest_background()
 
+    def closeEvent(self, event):
+        self._snapshot_session(clean=True)
+        super().closeEvent(event)
+
+# ----------------------------
+# Multi-lobby mode (coaches / casters)
+# ----------------------------
+LOBBIES = int(os.environ.get("SUMMONER_TRACKER_LOBBIES") or 0)  # N > 1: one tab per concurrent game
+LOBBY_TICK_SLACK_MS = 40  # Lobby ticks due within this of each other share one wakeup
+
+class TickScheduler(QObject):
+    """
+    One single-shot timer for any number of trackers: each asks to be ticked after an interval
+    and the timer is armed for the earliest deadline. Deadlines within LOBBY_TICK_SLACK_MS of it
+    fire in the same wakeup, a little late but never early (so no clock repeats a second).
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._due = {}  # tracker -> monotonic deadline
+        self._firing = False
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._fire)
+
+    def arm(self, tracker, interval_ms):
+        self._due[tracker] = time.monotonic() + interval_ms / 1000
+        self._rearm()
+
+    def disarm(self, tracker):
+        if self._due.pop(tracker, None) is not None:
+            self._rearm()
+
+    def _rearm(self):
+        if self._firing:
+            return  # _fire re-arms once every due tracker has rescheduled
+        if not self._due:
+            self.timer.stop()
+            return
+        first = min(self._due.values())
+        fire_at = max(at for at in self._due.values() if at <= first + LOBBY_TICK_SLACK_MS / 1000)
+        self.timer.start(max(0, math.ceil((fire_at - time.monotonic()) * 1000)))
+
+    def _fire(self):
+        now = time.monotonic()
+        due = [tracker for tracker, at in self._due.items() if at <= now]
+        self._firing = True
+        try:
+            for tracker in due:
+                del self._due[tracker]
+                tracker._on_tick_timer()  # re-arms itself through arm()
+        finally:
+            self._firing = False
+        self._rearm()
+
+class LobbyWindow(QTabWidget):
+    """
+    One window, one tab per game. Each lobby is a full CooldownTracker with its own clock, rows,
+    cooldowns and session file; all of them share the icon caches, the asset loader and one
+    TickScheduler. Lobbies in background tabs do not tick at all and catch up when shown.
+    """
+    def __init__(self, count):
+        super().__init__()
+        self.setWindowTitle(f"League Cooldown Tracker: {count} lobbies" + (" (offline)" if network.offline else ""))
+        self.resize(600, 240)
+        self.scheduler = TickScheduler(self)
+        self.lobbies = []
+        add_btn = QPushButton("+")
+        add_btn.setToolTip("Add a lobby")
+        add_btn.clicked.connect(self.add_lobby)
+        self.setCornerWidget(add_btn)
+        for _ in range(count):
+            self.add_lobby()
+        first = self.lobbies[0]  # window-level settings follow the first lobby
+        self.setWindowOpacity(first.window_opacity / 100.0)
+        if first.keep_on_top:
+            self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
+
+    def add_lobby(self):
+        lobby = CooldownTracker(lobby=len(self.lobbies) + 1, scheduler=self.scheduler)
+        self.lobbies.append(lobby)
+        self.addTab(lobby, f"Lobby {lobby.lobby}")
+        return lobby
+
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.WindowStateChange:
+            for lobby in self.lobbies:
+                lobby._on_tick()  # minimized: stop ticking; restored: catch up
+
+    def closeEvent(self, event):
+        for lobby in self.lobbies:
+            lobby._snapshot_session(clean=True)
+        super().closeEvent(event)
+
 # ----------------------------
 # Main
 # ----------------------------
 if __name__ == "__main__":
     app = QApplication(sys.argv)
-    window = CooldownTracker()
+    window = LobbyWindow(LOBBIES) if LOBBIES > 1 else CooldownTracker()
     window.show()
     sys.exit(app.exec_())